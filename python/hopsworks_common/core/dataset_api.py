@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import copy
+import io
 import logging
 import math
 import os
@@ -27,9 +28,14 @@ from concurrent.futures import ThreadPoolExecutor, wait
 from hopsworks_common import client, util
 from hopsworks_common.client.exceptions import DatasetException, RestAPIError
 from hopsworks_common.core import inode
+from hopsworks_common.core.constants import HAS_POLARS
 from tqdm.auto import tqdm
 
 
+if HAS_POLARS:
+    import polars as pl
+
+
 class Chunk:
     def __init__(self, content, number, status):
         self.content = content
@@ -468,28 +474,29 @@ class DatasetApi:
 
     def upload_feature_group(self, feature_group, path, dataframe):
         # Convert the dataframe into PARQUET for upload
-        df_parquet = dataframe.to_parquet(index=False)
+        if HAS_POLARS and isinstance(dataframe, pl.DataFrame):
+            # polars writes parquet straight from its arrow buffers
+            buffer = io.BytesIO()
+            dataframe.write_parquet(buffer)
+            df_parquet = buffer.getvalue()
+        else:
+            df_parquet = dataframe.to_parquet(index=False)
         parquet_length = len(df_parquet)
         num_chunks = math.ceil(parquet_length / self.DEFAULT_FLOW_CHUNK_SIZE)
 
+        file_name = util.feature_group_name(feature_group)
         base_params = self._get_flow_base_params(
-            feature_group, num_chunks, parquet_length, self.DEFAULT_FLOW_CHUNK_SIZE
+            file_name, num_chunks, parquet_length, self.DEFAULT_FLOW_CHUNK_SIZE
         )
 
         chunk_number = 1
         for i in range(0, parquet_length, self.DEFAULT_FLOW_CHUNK_SIZE):
+            chunk = df_parquet[i : i + self.DEFAULT_FLOW_CHUNK_SIZE]
             query_params = base_params
-            query_params["flowCurrentChunkSize"] = len(
-                df_parquet[i : i + self.DEFAULT_FLOW_CHUNK_SIZE]
-            )
+            query_params["flowCurrentChunkSize"] = len(chunk)
             query_params["flowChunkNumber"] = chunk_number
 
-            self._upload_request(
-                query_params,
-                path,
-                util.feature_group_name(feature_group),
-                df_parquet[i : i + self.DEFAULT_FLOW_CHUNK_SIZE],
-            )
+            self._upload_request(query_params, path, file_name, chunk)
 
             chunk_number += 1
 
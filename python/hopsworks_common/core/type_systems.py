@@ -19,7 +19,7 @@ from __future__ import annotations
 import ast
 import datetime
 import decimal
-from typing import TYPE_CHECKING, Literal, Union
+from typing import TYPE_CHECKING, Any, Dict, Literal, Union
 
 import pytz
 from hopsworks_common.core.constants import HAS_ARROW, HAS_PANDAS, HAS_POLARS
@@ -164,10 +164,27 @@ def convert_pandas_object_type_to_offline_type(arrow_type: str) -> str:
     raise ValueError(f"dtype 'O' (arrow_type '{str(arrow_type)}') not supported")
 
 
+def _pandas_column_has_type(
+    feature_column: pd.Series, hopsworks_type: str, dtype_mapping: Dict[str, Any]
+) -> bool:
+    # columns that already have the dtype a cast would produce can be returned as-is
+    if hopsworks_type == "timestamp":
+        return feature_column.dtype == "datetime64[ns]"
+    elif hopsworks_type == "boolean":
+        return feature_column.dtype == "bool"
+    # numpy compares float64 dtypes equal to None, so unmapped types are checked first
+    dtype = dtype_mapping.get(hopsworks_type)
+    return dtype is not None and feature_column.dtype == dtype
+
+
 def cast_pandas_column_to_offline_type(
     feature_column: pd.Series, offline_type: str
 ) -> pd.Series:
     offline_type = offline_type.lower()
+    if _pandas_column_has_type(
+        feature_column, offline_type, pandas_offline_dtype_mapping
+    ):
+        return feature_column
     if offline_type == "timestamp":
         return pd.to_datetime(feature_column, utc=True).dt.tz_localize(None)
     elif offline_type == "date":
@@ -195,6 +212,26 @@ def cast_pandas_column_to_offline_type(
             return feature_column  # handle gracefully, just return the column as-is
 
 
+def cast_pandas_columns_to_offline_type(
+    df: pd.DataFrame, offline_types: Dict[str, str]
+) -> pd.DataFrame:
+    # columns with a plain pandas dtype mapping are cast together with a single
+    # astype, the others go through cast_pandas_column_to_offline_type one by one
+    dtypes = {}
+    for name, offline_type in offline_types.items():
+        offline_type = offline_type.lower()
+        if offline_type in pandas_offline_dtype_mapping:
+            if not _pandas_column_has_type(
+                df[name], offline_type, pandas_offline_dtype_mapping
+            ):
+                dtypes[name] = pandas_offline_dtype_mapping[offline_type]
+        else:
+            df[name] = cast_pandas_column_to_offline_type(df[name], offline_type)
+    if dtypes:
+        df = df.astype(dtypes, copy=False)
+    return df
+
+
 def cast_polars_column_to_offline_type(
     feature_column: pl.Series, offline_type: str
 ) -> pl.Series:
@@ -240,6 +277,10 @@ def cast_column_to_online_type(
     feature_column: pd.Series, online_type: str
 ) -> pd.Series:
     online_type = online_type.lower()
+    if _pandas_column_has_type(
+        feature_column, online_type, pandas_online_dtype_mapping
+    ):
+        return feature_column
     if online_type == "timestamp":
         # convert (if tz!=UTC) to utc, then make timezone unaware
         return pd.to_datetime(feature_column, utc=True).dt.tz_localize(None)
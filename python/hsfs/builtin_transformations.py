@@ -14,7 +14,6 @@
 #   limitations under the License.
 #
 
-import numpy as np
 import pandas as pd
 from hsfs.hopsworks_udf import udf
 from hsfs.transformation_statistics import TransformationStatistics
@@ -46,13 +45,13 @@ def robust_scaler(feature: pd.Series, statistics=feature_statistics) -> pd.Serie
 def label_encoder(feature: pd.Series, statistics=feature_statistics) -> pd.Series:
     unique_data = sorted([value for value in statistics.feature.unique_values])
     value_to_index = {value: index for index, value in enumerate(unique_data)}
+    # Look up the whole column at once instead of one value at a time.
+    encoded = feature.map(value_to_index)
     # Unknown categories not present in training dataset are encoded as -1.
-    return pd.Series(
-        [
-            value_to_index.get(data, -1) if not pd.isna(data) else np.nan
-            for data in feature
-        ]
-    )
+    encoded = encoded.where(encoded.notna() | feature.isna(), -1)
+    if not encoded.isna().any():
+        encoded = encoded.astype("int64")
+    return encoded.reset_index(drop=True)
 
 
 @udf(bool, drop=["feature"])
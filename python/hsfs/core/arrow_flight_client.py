@@ -398,6 +398,8 @@ class ArrowFlightClient:
         _logger.debug("Dataset fetched. Converting to dataframe %s.", dataframe_type)
         if dataframe_type.lower() == "polars":
             return pl.from_arrow(reader.read_all())
+        elif dataframe_type.lower() == "pyarrow":
+            return reader.read_all()
         else:
             return reader.read_pandas()
 
@@ -22,6 +22,7 @@ from hopsworks_common.core.constants import (
     HAS_FAST_AVRO,
     HAS_GREAT_EXPECTATIONS,
     HAS_NUMPY,
+    HAS_ORJSON,
     HAS_PANDAS,
     HAS_POLARS,
     HAS_SQLALCHEMY,
@@ -38,6 +39,7 @@ __all__ = [
     "HAS_FAST_AVRO",
     "HAS_GREAT_EXPECTATIONS",
     "HAS_NUMPY",
+    "HAS_ORJSON",
     "HAS_PANDAS",
     "HAS_POLARS",
     "HAS_SQLALCHEMY",
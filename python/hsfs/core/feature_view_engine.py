@@ -364,11 +364,12 @@ class FeatureViewEngine:
             )
         else:
             self._check_feature_group_accessibility(feature_view_obj)
+            start_time, end_time = self._get_training_data_event_time_range(td_updated)
             query = self.get_batch_query(
                 feature_view_obj,
                 training_dataset_version=td_updated.version,
-                start_time=td_updated.event_start_time,
-                end_time=td_updated.event_end_time,
+                start_time=start_time,
+                end_time=end_time,
                 with_label=True,
                 inference_helper_columns=False,
                 primary_keys=primary_keys,
@@ -407,6 +408,31 @@ class FeatureViewEngine:
             )
             return td_updated, split_df
 
+    @staticmethod
+    def _get_training_data_event_time_range(training_dataset_obj):
+        # time series splits are made in memory, only read the rows from the start
+        # of the first split to the end of the last split
+        time_splits = [
+            split
+            for split in training_dataset_obj.splits
+            if split.split_type == TrainingDatasetSplit.TIME_SERIES_SPLIT
+        ]
+        if (
+            training_dataset_obj.event_start_time
+            or training_dataset_obj.event_end_time
+            or not time_splits
+        ):
+            return (
+                training_dataset_obj.event_start_time,
+                training_dataset_obj.event_end_time,
+            )
+        start_times = [split.start_time for split in time_splits]
+        end_times = [split.end_time for split in time_splits]
+        return (
+            None if None in start_times else min(start_times),
+            None if None in end_times else max(end_times),
+        )
+
     def _set_event_time(self, feature_view_obj, training_dataset_obj):
         event_time = feature_view_obj.query._left_feature_group.event_time
         if event_time:
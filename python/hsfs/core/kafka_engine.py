@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple, Union
 
@@ -173,14 +174,22 @@ def kafka_produce(
 def encode_complex_features(
     feature_writers: Dict[str, callable], row: Dict[str, Any]
 ) -> Dict[str, Any]:
-    for feature_name, writer in feature_writers.items():
-        with BytesIO() as outf:
+    if not feature_writers:
+        return row
+    # the same buffer is reused to encode every complex feature of the row
+    with BytesIO() as outf:
+        for feature_name, writer in feature_writers.items():
+            outf.seek(0)
+            outf.truncate()
             writer(row[feature_name], outf)
             row[feature_name] = outf.getvalue()
     return row
 
 
+@lru_cache(maxsize=128)
 def get_encoder_func(writer_schema: str) -> callable:
+    # cached on the schema string, so that repeated inserts into the same feature
+    # group do not parse the same avro schemas again for every batch
     if HAS_FAST_AVRO:
         schema = json.loads(writer_schema)
         parsed_schema = parse_schema(schema)
@@ -18,8 +18,18 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import re
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from hopsworks_common.core import variable_api
 from hsfs import util
@@ -64,6 +74,7 @@ class OnlineStoreSqlClient:
         external: bool,
         serving_keys: Optional[Set[ServingKey]] = None,
         connection_options: Optional[Dict[str, Any]] = None,
+        result_value_handlers: Optional[Dict[str, Callable[[Any], Any]]] = None,
     ):
         _logger.debug("Initialising Online Store Sql Client")
         self._feature_store_id = feature_store_id
@@ -75,6 +86,9 @@ class OnlineStoreSqlClient:
         self._serving_key_by_serving_index: Dict[str, ServingKey] = {}
         self._connection_pool = None
         self._serving_keys: Set[ServingKey] = set(serving_keys or [])
+        self._result_value_handlers: Dict[str, Callable[[Any], Any]] = (
+            result_value_handlers or {}
+        )
 
         self._prepared_statements: Dict[str, List[ServingPreparedStatement]] = {}
         self._parametrised_prepared_statements = {}
@@ -99,6 +113,9 @@ class OnlineStoreSqlClient:
                 f"Initialising prepared statements for feature view {entity.name} version {entity.version}."
             )
             for key in self.get_prepared_statement_labels(inference_helper_columns):
+                if key in self.prepared_statements:
+                    _logger.debug(f"Reusing prepared statement for key {key}")
+                    continue
                 _logger.debug(f"Fetching prepared statement for key {key}")
                 self.prepared_statements[key] = (
                     self.feature_view_api.get_serving_prepared_statement(
@@ -116,6 +133,9 @@ class OnlineStoreSqlClient:
             for key in self.get_prepared_statement_labels(
                 with_inference_helper_column=False
             ):
+                if key in self.prepared_statements:
+                    _logger.debug(f"Reusing prepared statement for key {key}")
+                    continue
                 _logger.debug(f"Fetching prepared statement for key {key}")
                 self.prepared_statements[key] = (
                     self.training_dataset_api.get_serving_prepared_statement(
@@ -163,40 +183,37 @@ class OnlineStoreSqlClient:
         self,
         prepared_statements: List[ServingPreparedStatement],
     ) -> None:
-        _logger.debug(
-            "Initializing parametrize and serving utils property using %s",
-            json.dumps(prepared_statements, default=lambda x: x.__dict__, indent=2),
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            # only serialize the prepared statements if they are going to be logged
+            _logger.debug(
+                "Initializing parametrize and serving utils property using %s",
+                json.dumps(prepared_statements, default=lambda x: x.__dict__, indent=2),
+            )
         self.prefix_by_serving_index = {
             statement.prepared_statement_index: statement.prefix
             for statement in prepared_statements
         }
         self._feature_name_order_by_psp = {
-            statement.prepared_statement_index: dict(
-                [
-                    (param.name, param.index)
-                    for param in statement.prepared_statement_parameters
-                ]
-            )
+            statement.prepared_statement_index: {
+                param.name: param.index
+                for param in statement.prepared_statement_parameters
+            }
             for statement in prepared_statements
         }
 
         _logger.debug("Build serving keys by PreparedStatementParameter.index")
         for sk in self._serving_keys:
-            self.serving_key_by_serving_index[sk.join_index] = (
-                self.serving_key_by_serving_index.get(sk.join_index, []) + [sk]
-            )
+            self.serving_key_by_serving_index.setdefault(sk.join_index, []).append(sk)
         _logger.debug("Sort serving keys by PreparedStatementParameter.index")
-        for join_index in self.serving_key_by_serving_index:
+        for join_index, serving_keys in self.serving_key_by_serving_index.items():
             # feature_name_order_by_psp do not include the join index when the joint feature only contains label only
             # But _serving_key_by_serving_index include the index when the join_index is 0 (left side)
-            if join_index in self._feature_name_order_by_psp:
-                self.serving_key_by_serving_index[join_index] = sorted(
-                    self.serving_key_by_serving_index[join_index],
-                    key=lambda _sk,
-                    join_index=join_index: self.feature_name_order_by_psp[
-                        join_index
-                    ].get(_sk.feature_name, 0),
+            feature_name_order = self._feature_name_order_by_psp.get(join_index)
+            if feature_name_order is not None:
+                serving_keys.sort(
+                    key=lambda _sk, order=feature_name_order: order.get(
+                        _sk.feature_name, 0
+                    )
                 )
 
     def _parametrize_prepared_statements(
@@ -286,7 +303,7 @@ class OnlineStoreSqlClient:
     ) -> Dict[str, Any]:
         """Retrieve single vector with parallel queries using aiomysql engine."""
 
-        if all([isinstance(val, list) for val in entry.values()]):
+        if all(isinstance(val, list) for val in entry.values()):
             raise ValueError(
                 "Entry is expected to be single value per primary key. "
                 "If you have already initialised prepared statements for single vector and now want to retrieve "
@@ -302,9 +319,9 @@ class OnlineStoreSqlClient:
             pk_entry = {}
             next_statement = False
             for sk in self.serving_key_by_serving_index[prepared_statement_index]:
-                if sk.required_serving_key not in entry.keys():
+                if sk.required_serving_key not in entry:
                     # Check if there is any entry matched with feature name.
-                    if sk.feature_name in entry.keys():
+                    if sk.feature_name in entry:
                         pk_entry[sk.feature_name] = entry[sk.feature_name]
                     else:
                         # User did not provide the necessary serving keys, we expect they have
@@ -329,13 +346,13 @@ class OnlineStoreSqlClient:
         results_dict = loop.run_until_complete(
             self._execute_prep_statements(prepared_statement_execution, bind_entries)
         )
-        _logger.debug(f"Retrieved feature vectors: {results_dict}")
+        _logger.debug("Retrieved feature vectors: %s", results_dict)
         _logger.debug("Constructing serving vector from results")
         for key in results_dict:
             for row in results_dict[key]:
-                _logger.debug(f"Processing row: {row} for prepared statement {key}")
-                result_dict = dict(row)
-                serving_vector.update(result_dict)
+                _logger.debug("Processing row: %s for prepared statement %s", row, key)
+                # rows are mappings, merge them without an intermediate dict copy
+                serving_vector.update(row)
 
         return serving_vector
 
@@ -366,22 +383,18 @@ class OnlineStoreSqlClient:
             prepared_stmts_to_execute[prepared_statement_index] = (
                 prepared_statement_objects[prepared_statement_index]
             )
+            serving_keys = self.serving_key_by_serving_index[prepared_statement_index]
+            # deduplicate repeated keys, the results are scattered back to every
+            # entry with the same key when stitching the batch results below
             entry_values_tuples = list(
-                map(
-                    lambda e, prepared_statement_index=prepared_statement_index: tuple(
-                        [
-                            (
-                                e.get(sk.required_serving_key)
-                                # Check if there is any entry matched with feature name,
-                                # if the required serving key is not provided.
-                                or e.get(sk.feature_name)
-                            )
-                            for sk in self.serving_key_by_serving_index[
-                                prepared_statement_index
-                            ]
-                        ]
-                    ),
-                    entries,
+                dict.fromkeys(
+                    tuple(
+                        # Check if there is any entry matched with feature name,
+                        # if the required serving key is not provided.
+                        e.get(sk.required_serving_key) or e.get(sk.feature_name)
+                        for sk in serving_keys
+                    )
+                    for e in entries
                 )
             )
             _logger.debug(
@@ -414,31 +427,22 @@ class OnlineStoreSqlClient:
             )
             _logger.debug("iterate over results by index of the prepared statement")
             for row in parallel_results[prepared_statement_index]:
-                _logger.debug(f"Processing row: {row}")
-                row_dict = dict(row)
+                # rows are read-only mappings, keep them as they are and only copy
+                # their values when merging them into the batch results below.
                 # can primary key be complex feature? No, not supported.
-                result_dict = row_dict
+                result_key = self._get_result_key(prefix_features, row)
                 _logger.debug(
-                    f"Add result to statement results: {self._get_result_key(prefix_features, row_dict)} : {result_dict}"
-                )
-                statement_results[self._get_result_key(prefix_features, row_dict)] = (
-                    result_dict
+                    "Add result to statement results: %s : %s", result_key, row
                 )
+                statement_results[result_key] = row
 
-            _logger.debug(f"Add partial results to batch results: {statement_results}")
+            _logger.debug("Add partial results to batch results: %s", statement_results)
             for i, entry in enumerate(entries):
-                _logger.debug(
-                    "Processing entry %s : %s",
-                    entry,
-                    statement_results.get(
-                        self._get_result_key_serving_key(serving_keys, entry), {}
-                    ),
-                )
-                batch_results[i].update(
-                    statement_results.get(
-                        self._get_result_key_serving_key(serving_keys, entry), {}
-                    )
+                entry_result = statement_results.get(
+                    self._get_result_key_serving_key(serving_keys, entry), {}
                 )
+                _logger.debug("Processing entry %s : %s", entry, entry_result)
+                batch_results[i].update(entry_result)
         return batch_results, serving_keys_all_fg
 
     def _get_or_create_event_loop(self):
@@ -486,49 +490,25 @@ class OnlineStoreSqlClient:
     @staticmethod
     def _parametrize_query(name: str, query_online: str) -> str:
         # Now we have ordered pk_names, iterate over it and replace `?` with `:feature_name` one by one.
-        # Regex `"^(.*?)\?"` will identify 1st occurrence of `?` in the sql string and replace it with provided
-        # feature name, e.g. `:feature_name`:. As we iteratively update `query_online` we are always aiming to
-        # replace 1st occurrence of `?`. This approach can only work if primary key names are sorted properly.
-        # Regex `"^(.*?)\?"`:
-        # `^` - asserts position at start of a line
-        # `.*?` - matches any character (except for line terminators). `*?` Quantifier —
-        # Matches between zero and unlimited times, expanding until needed, i.e 1st occurrence of `\?`
-        # character.
-        _logger.debug(f"Parametrizing name {name} in query {query_online}")
-        return re.sub(
-            r"^(.*?)\?",
-            r"\1:" + name,
-            query_online,
-        )
+        # As we iteratively update `query_online` we are always aiming to replace the 1st occurrence of `?`.
+        # This approach can only work if primary key names are sorted properly.
+        _logger.debug("Parametrizing name %s in query %s", name, query_online)
+        return query_online.replace("?", ":" + name, 1)
 
     @staticmethod
     def _get_result_key(
-        primary_keys: List[str], result_dict: Dict[str, str]
+        primary_keys: List[str], result_dict: Mapping[str, str]
     ) -> Tuple[str]:
-        _logger.debug(f"Get result key {primary_keys} from result dict {result_dict}")
-        result_key = []
-        for pk in primary_keys:
-            result_key.append(result_dict.get(pk))
-        return tuple(result_key)
+        return tuple(result_dict.get(pk) for pk in primary_keys)
 
     @staticmethod
     def _get_result_key_serving_key(
         serving_keys: List[ServingKey], result_dict: Dict[str, Dict[str, Any]]
     ) -> Tuple[str]:
-        _logger.debug(
-            f"Get result key serving key {serving_keys} from result dict {result_dict}"
+        return tuple(
+            result_dict.get(sk.required_serving_key) or result_dict.get(sk.feature_name)
+            for sk in serving_keys
         )
-        result_key = []
-        for sk in serving_keys:
-            _logger.debug(
-                f"Get result key for serving key {sk.required_serving_key} or {sk.feature_name}"
-            )
-            result_key.append(
-                result_dict.get(sk.required_serving_key)
-                or result_dict.get(sk.feature_name)
-            )
-        _logger.debug(f"Result key: {result_key}")
-        return tuple(result_key)
 
     @staticmethod
     def get_prepared_statement_labels(
@@ -573,7 +553,29 @@ class OnlineStoreSqlClient:
             _logger.debug(f"Retrieved resultset: {resultset}. Closing cursor.")
             await cursor.close()
 
-        return resultset
+        # decode the resultset while the queries of the other feature groups are
+        # still waiting on the database, instead of after all of them returned
+        return self._handle_result_values(resultset)
+
+    def _handle_result_values(self, resultset):
+        """Apply the result value handlers to the columns of the resultset they are defined for."""
+        if len(self._result_value_handlers) == 0 or len(resultset) == 0:
+            return resultset
+        columns = [
+            column
+            for column in resultset[0].keys()
+            if column in self._result_value_handlers
+        ]
+        if len(columns) == 0:
+            return resultset
+
+        handled_resultset = []
+        for row in resultset:
+            row = dict(row)
+            for column in columns:
+                row[column] = self._result_value_handlers[column](row[column])
+            handled_resultset.append(row)
+        return handled_resultset
 
     async def _execute_prep_statements(
         self,
@@ -591,6 +593,14 @@ class OnlineStoreSqlClient:
                 if key not in entries:
                     prepared_statements.pop(key)
 
+        if len(prepared_statements) == 1:
+            # Single feature group, query it directly on a pooled connection
+            # without scheduling and gathering a task.
+            key = next(iter(prepared_statements))
+            return {
+                key: await self._query_async_sql(prepared_statements[key], entries[key])
+            }
+
         try:
             tasks = [
                 asyncio.create_task(
@@ -37,6 +37,9 @@ class TrainingDatasetEngine:
             feature_store_id
         )
         self._tags_api = tags_api.TagsApi(feature_store_id, self.ENTITY_TYPE)
+        # the query of a training dataset version does not change once it is created,
+        # keep the backend response to avoid a round-trip on every `query()` call
+        self._fs_query_cache = {}
 
     def save(self, training_dataset, features, user_write_options):
         if isinstance(features, query.Query):
@@ -98,9 +101,7 @@ class TrainingDatasetEngine:
         )
 
     def query(self, training_dataset, online, with_label, is_hive_query):
-        fs_query = self._training_dataset_api.get_query(
-            training_dataset, with_label, is_hive_query
-        )
+        fs_query = self._get_fs_query(training_dataset, with_label, is_hive_query)
 
         if online:
             return fs_query.query_online
@@ -120,6 +121,19 @@ class TrainingDatasetEngine:
 
         return fs_query.query
 
+    def _get_fs_query(self, training_dataset, with_label, is_hive_query):
+        if training_dataset.id is None:
+            return self._training_dataset_api.get_query(
+                training_dataset, with_label, is_hive_query
+            )
+
+        cache_key = (training_dataset.id, with_label, is_hive_query)
+        if cache_key not in self._fs_query_cache:
+            self._fs_query_cache[cache_key] = self._training_dataset_api.get_query(
+                training_dataset, with_label, is_hive_query
+            )
+        return self._fs_query_cache[cache_key]
+
     def add_tag(self, training_dataset, name, value):
         """Attach a name/value tag to a training dataset."""
         self._tags_api.add(training_dataset, name, value)
@@ -19,6 +19,7 @@ from hopsworks_common.core.type_systems import (
     cast_column_to_offline_type,
     cast_column_to_online_type,
     cast_pandas_column_to_offline_type,
+    cast_pandas_columns_to_offline_type,
     cast_polars_column_to_offline_type,
     convert_pandas_dtype_to_offline_type,
     convert_pandas_object_type_to_offline_type,
@@ -34,6 +35,7 @@ __all__ = [
     "cast_column_to_offline_type",
     "cast_column_to_online_type",
     "cast_pandas_column_to_offline_type",
+    "cast_pandas_columns_to_offline_type",
     "cast_polars_column_to_offline_type",
     "convert_pandas_dtype_to_offline_type",
     "convert_pandas_object_type_to_offline_type",
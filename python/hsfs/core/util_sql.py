@@ -31,6 +31,11 @@ if HAS_AIOMYSQL:
     from aiomysql.sa import create_engine as async_create_engine
 
 
+# Recycle pooled connections before the server closes them for being idle, so that
+# serving requests keep reusing live connections instead of failing and reconnecting.
+DEFAULT_POOL_RECYCLE = 3600
+
+
 def create_mysql_engine(
     online_conn: Any, external: bool, options: Optional[Dict[str, Any]] = None
 ) -> Any:
@@ -67,9 +72,9 @@ def create_mysql_engine(
     if options is not None and not isinstance(options, dict):
         raise TypeError("`options` should be a `dict` type.")
     if not options:
-        options = {"pool_recycle": 3600}
+        options = {"pool_recycle": DEFAULT_POOL_RECYCLE}
     elif "pool_recycle" not in options:
-        options["pool_recycle"] = 3600
+        options["pool_recycle"] = DEFAULT_POOL_RECYCLE
     # default connection pool size kept by engine is 5
     sql_alchemy_engine = create_engine(sql_alchemy_conn_str, **options)
     return sql_alchemy_engine
@@ -114,6 +119,10 @@ async def create_async_engine(
         maxsize=(
             options.get("maxsize", default_min_size) if options else default_min_size
         ),
-        pool_recycle=(options.get("pool_recycle", -1) if options else -1),
+        pool_recycle=(
+            options.get("pool_recycle", DEFAULT_POOL_RECYCLE)
+            if options
+            else DEFAULT_POOL_RECYCLE
+        ),
     )
     return pool
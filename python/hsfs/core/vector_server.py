@@ -16,10 +16,12 @@
 from __future__ import annotations
 
 import itertools
+import json
 import logging
 import warnings
 from base64 import b64decode
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from decimal import Decimal
 from io import BytesIO
 from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
 
@@ -50,7 +52,7 @@ from hsfs.core import (
 
 HAS_FASTAVRO = False
 try:
-    from fastavro import schemaless_reader
+    from fastavro import parse_schema, schemaless_reader
 
     HAS_FASTAVRO = True
 except ImportError:
@@ -235,12 +237,25 @@ class VectorServer:
         options: Optional[Dict[str, Any]] = None,
     ) -> None:
         _logger.debug("Initialising Online Store SQL client")
+        previous_sql_client = self._sql_client
         self._sql_client = online_store_sql_engine.OnlineStoreSqlClient(
             feature_store_id=self._feature_store_id,
             skip_fg_ids=self._skip_fg_ids,
             serving_keys=self.serving_keys,
             external=external,
+            # complex features are deserialized as soon as their feature group is fetched
+            result_value_handlers={
+                fname: self.return_feature_value_handlers[fname]
+                for fname in self.feature_to_handle_if_sql
+                if fname in self.return_feature_value_handlers
+            },
         )
+        if previous_sql_client is not None:
+            # The prepared statements of an entity do not change when re-initialising
+            # serving, reuse them instead of fetching them again from the backend.
+            self._sql_client.prepared_statements = dict(
+                previous_sql_client.prepared_statements
+            )
         self.sql_client.init_prepared_statements(
             entity,
             inference_helper_columns,
@@ -444,10 +459,11 @@ class VectorServer:
             batch_results = []
 
         _logger.debug("Assembling feature vectors from batch results")
-        next_skipped = (
-            skipped_empty_entries.pop(0) if len(skipped_empty_entries) > 0 else None
-        )
-        vectors = []
+        # walk the results in entry order instead of popping from the front of the lists
+        skipped_empty_entries = set(skipped_empty_entries)
+        batch_results = iter(batch_results)
+        feature_dicts = []
+        feature_dicts_request_parameters = []
 
         # If request parameter is a dictionary then copy it to list with the same length as that of entires
         request_parameters = (
@@ -467,29 +483,37 @@ class VectorServer:
             request_parameters or [],
             fillvalue=None,
         ):
-            if next_skipped == idx:
+            if idx in skipped_empty_entries:
                 _logger.debug("Entry %d was skipped, setting to empty dict.", idx)
-                next_skipped = (
-                    skipped_empty_entries.pop(0)
-                    if len(skipped_empty_entries) > 0
-                    else None
-                )
                 result_dict = {}
             else:
-                result_dict = batch_results.pop(0)
+                result_dict = next(batch_results)
 
-            vector = self.assemble_feature_vector(
+            feature_dict = self.assemble_feature_dict(
                 result_dict=result_dict,
                 passed_values=passed_values,
                 vector_db_result=vector_db_result,
                 allow_missing=allow_missing,
                 client=online_client_choice,
-                transform=transform,
                 request_parameters=request_parameter,
             )
 
-            if vector is not None:
-                vectors.append(vector)
+            if feature_dict is not None:
+                feature_dicts.append(feature_dict)
+                feature_dicts_request_parameters.append(request_parameter or {})
+
+        if (
+            len(self.model_dependent_transformation_functions) > 0
+            or len(self.on_demand_transformation_functions) > 0
+        ) and transform:
+            # transform the whole batch at once instead of one feature vector at a time
+            self.apply_batch_transformation(
+                feature_dicts, feature_dicts_request_parameters
+            )
+        vectors = [
+            self.feature_dict_to_vector(feature_dict, transform=transform)
+            for feature_dict in feature_dicts
+        ]
 
         return self.handle_feature_vector_return_type(
             vectors,
@@ -511,6 +535,39 @@ class VectorServer:
         request_parameters: Optional[Dict[str, Any]] = None,
     ) -> Optional[List[Any]]:
         """Assembles serving vector from online feature store."""
+        result_dict = self.assemble_feature_dict(
+            result_dict=result_dict,
+            passed_values=passed_values,
+            vector_db_result=vector_db_result,
+            allow_missing=allow_missing,
+            client=client,
+            request_parameters=request_parameters,
+        )
+        if result_dict is None:
+            return None
+
+        if (
+            len(self.model_dependent_transformation_functions) > 0
+            or len(self.on_demand_transformation_functions) > 0
+        ) and transform:
+            self.apply_transformation(result_dict, request_parameters or {})
+
+        _logger.debug("Assembled and transformed dict feature vector: %s", result_dict)
+        return self.feature_dict_to_vector(result_dict, transform=transform)
+
+    def assemble_feature_dict(
+        self,
+        result_dict: Dict[str, Any],
+        passed_values: Optional[Dict[str, Any]],
+        vector_db_result: Optional[Dict[str, Any]],
+        allow_missing: bool,
+        client: Literal["rest", "sql"],
+        request_parameters: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Assembles the untransformed feature values of a serving vector as a dictionary.
+
+        Returns `None` if the result is empty and missing features are not allowed.
+        """
         # Errors in batch requests are returned as None values
         _logger.debug("Assembling serving vector: %s", result_dict)
         if result_dict is None:
@@ -552,21 +609,20 @@ class VectorServer:
 
         if len(self.return_feature_value_handlers) > 0:
             self.apply_return_value_handlers(result_dict, client=client)
-        if (
-            len(self.model_dependent_transformation_functions) > 0
-            or len(self.on_demand_transformation_functions) > 0
-        ) and transform:
-            self.apply_transformation(result_dict, request_parameters or {})
+        return result_dict
 
-        _logger.debug("Assembled and transformed dict feature vector: %s", result_dict)
+    def feature_dict_to_vector(
+        self, feature_dict: Dict[str, Any], transform: bool
+    ) -> List[Any]:
+        """Order the values of a feature dictionary according to the feature vector columns."""
         if transform:
             return [
-                result_dict.get(fname, None)
+                feature_dict.get(fname, None)
                 for fname in self.transformed_feature_vector_col_name
             ]
         else:
             return [
-                result_dict.get(fname, None)
+                feature_dict.get(fname, None)
                 for fname in self._untransformed_feature_vector_col_name
             ]
 
@@ -818,9 +874,9 @@ class VectorServer:
             elif batch:
                 return pd.DataFrame(feature_vectorz, columns=column_names)
             else:
-                pandas_df = pd.DataFrame(feature_vectorz).transpose()
-                pandas_df.columns = column_names
-                return pandas_df
+                # build the single row directly, like the batch case, instead of
+                # building a column and transposing it which loses the column dtypes
+                return pd.DataFrame([feature_vectorz], columns=column_names)
         elif return_type.lower() == "polars":
             _logger.debug("Returning feature vector as polars dataframe")
             return pl.DataFrame(
@@ -1036,15 +1092,105 @@ class VectorServer:
         encoded_feature_dict = self.apply_model_dependent_transformations(feature_dict)
         return encoded_feature_dict
 
+    def apply_batch_transformation(
+        self,
+        rows: List[Dict[str, Any]],
+        request_parameters: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Function that applies both on-demand and model dependent transformation to a batch of feature dictionaries.
+
+        Each transformation function is called once with columns spanning the whole batch, the results are
+        written back to the input dictionaries. If a column of the batch would not get the dtype its values get
+        when transformed one dictionary at a time, e.g. because of missing or array values, the dictionaries are
+        transformed one by one with `apply_transformation` instead.
+        """
+        batch_rows = [dict(row) for row in rows]
+        if self._apply_batch_transformation(batch_rows, request_parameters):
+            for row, batch_row in zip(rows, batch_rows):
+                row.update(batch_row)
+        else:
+            _logger.debug("Applying transformation functions to each row of batch.")
+            for row, request_parameter in zip(rows, request_parameters):
+                self.apply_transformation(row, request_parameter)
+        return rows
+
+    def _apply_batch_transformation(
+        self,
+        rows: List[Dict[str, Any]],
+        request_parameters: List[Dict[str, Any]],
+    ) -> bool:
+        _logger.debug("Applying On-Demand transformation functions to batch.")
+        for tf in self._on_demand_transformation_functions:
+            # Check if feature provided as request parameter if not get it from retrieved feature vector.
+            features = [
+                self._batch_feature_column(
+                    [
+                        request_parameter[feature]
+                        if feature in request_parameter
+                        else row[feature]
+                        for row, request_parameter in zip(rows, request_parameters)
+                    ]
+                )
+                for feature in tf.hopsworks_udf.transformation_features
+            ]
+            if any(feature is None for feature in features):
+                return False
+            on_demand_feature = tf.hopsworks_udf.get_udf(force_python_udf=True)(
+                *features
+            )  # Get only python compatible UDF irrespective of engine
+            for row, value in zip(rows, on_demand_feature.values):
+                row[on_demand_feature.name] = value
+
+        _logger.debug("Applying Model-Dependent transformation functions to batch.")
+        for tf in self.model_dependent_transformation_functions:
+            features = [
+                self._batch_feature_column([row[feature] for row in rows])
+                for feature in tf.hopsworks_udf.transformation_features
+            ]
+            if any(feature is None for feature in features):
+                return False
+            transformed_result = tf.hopsworks_udf.get_udf(force_python_udf=True)(
+                *features
+            )  # Get only python compatible UDF irrespective of engine
+            if isinstance(transformed_result, pd.Series):
+                for row, value in zip(rows, transformed_result.values):
+                    row[transformed_result.name] = value
+            else:
+                for col in transformed_result:
+                    for row, value in zip(rows, transformed_result[col].values):
+                        row[col] = value
+        return True
+
+    @staticmethod
+    def _batch_feature_column(values: List[Any]) -> Optional[pd.Series]:
+        # the values of a column are only batched when they are scalars of one type, for
+        # which pandas infers the same dtype for the column as for each value on its own
+        value_types = {type(value) for value in values}
+        if len(value_types) != 1:
+            return None
+        value_type = value_types.pop()
+        if value_type is int:
+            if not -(2**63) <= min(values) <= max(values) < 2**63:
+                return None
+        elif issubclass(value_type, datetime):
+            if len({value.tzinfo for value in values}) != 1:
+                return None
+        elif not issubclass(value_type, (bool, float, str, date, Decimal, np.generic)):
+            return None
+        return pd.Series(values)
+
     def apply_return_value_handlers(
         self, row_dict: Dict[str, Any], client: Literal["rest", "sql"]
     ):
         if client == self.DEFAULT_REST_CLIENT:
-            matching_keys = self.feature_to_handle_if_rest.intersection(row_dict.keys())
+            features_to_handle = self.feature_to_handle_if_rest
         else:
-            matching_keys = set(self.feature_to_handle_if_sql).intersection(
-                row_dict.keys()
-            )
+            features_to_handle = self.feature_to_handle_if_sql
+        if len(features_to_handle) == 0:
+            # e.g. no complex features, nothing to deserialize for this client
+            return row_dict
+        matching_keys = features_to_handle.intersection(row_dict.keys())
         _logger.debug("Applying return value handlers to : %s", matching_keys)
         for fname in matching_keys:
             _logger.debug("Applying return value handler to feature: %s", fname)
@@ -1058,69 +1204,53 @@ class VectorServer:
             - deserialization of complex features from the online feature store
             - conversion of string or int timestamps to datetime objects
         """
-        complex_feature_schemas = {
-            f.name: avro.io.DatumReader(
-                avro.schema.parse(
-                    f._feature_group._get_feature_avro_schema(
-                        f.feature_group_feature_name
-                    )
-                )
-            )
-            for f in self._features
-            if f.is_complex()
-        }
+        complex_features = [f for f in self._features if f.is_complex()]
 
-        if len(complex_feature_schemas) == 0:
+        if len(complex_features) == 0:
             return {}
         else:
             _logger.debug(
-                f"Building complex feature decoders corresponding to {complex_feature_schemas}."
+                f"Building complex feature decoders corresponding to {[f.name for f in complex_features]}."
             )
         if HAS_FASTAVRO:
             _logger.debug("Using fastavro for deserialization.")
-            return {
-                f_name: (
-                    lambda feature_value, avro_schema=schema: (
-                        schemaless_reader(
-                            BytesIO(
-                                feature_value
-                                if isinstance(feature_value, bytes)
-                                else b64decode(feature_value)
-                            ),
-                            avro_schema.writers_schema.to_json(),
-                        )
-                        # embedded features are deserialized already but not complex features stored in Opensearch
-                        if (
-                            isinstance(feature_value, bytes)
-                            or isinstance(feature_value, str)
-                        )
-                        else feature_value
-                    )
-                )
-                for (f_name, schema) in complex_feature_schemas.items()
-            }
         else:
             _logger.debug("Fast Avro not found, using avro for deserialization.")
-            return {
-                f_name: (
-                    lambda feature_value, avro_schema=schema: avro_schema.read(
-                        BinaryDecoder(
-                            BytesIO(
-                                feature_value
-                                if isinstance(feature_value, bytes)
-                                else b64decode(feature_value)
-                            )
-                        )
-                    )
-                    # embedded features are deserialized already but not complex features stored in Opensearch
-                    if (
-                        isinstance(feature_value, str)
-                        or isinstance(feature_value, bytes)
-                    )
-                    else feature_value
-                )
-                for (f_name, schema) in complex_feature_schemas.items()
-            }
+        return {
+            f.name: self._build_complex_feature_decoder(
+                f._feature_group._get_feature_avro_schema(f.feature_group_feature_name)
+            )
+            for f in complex_features
+        }
+
+    @staticmethod
+    def _build_complex_feature_decoder(avro_schema: str) -> Callable[[Any], Any]:
+        """Build a decoder specialised to the avro schema of a single complex feature.
+
+        The schema is parsed once and bound to the decoder, so decoding a value only
+        dispatches on its type before handing the bytes to the avro reader.
+        """
+        if HAS_FASTAVRO:
+            parsed_schema = parse_schema(json.loads(avro_schema))
+
+            def read(value: bytes) -> Any:
+                return schemaless_reader(BytesIO(value), parsed_schema)
+
+        else:
+            datum_reader = avro.io.DatumReader(avro.schema.parse(avro_schema))
+
+            def read(value: bytes) -> Any:
+                return datum_reader.read(BinaryDecoder(BytesIO(value)))
+
+        def decode(feature_value: Any) -> Any:
+            if isinstance(feature_value, bytes):
+                return read(feature_value)
+            elif isinstance(feature_value, str):
+                return read(b64decode(feature_value))
+            # embedded features are deserialized already but not complex features stored in Opensearch
+            return feature_value
+
+        return decode
 
     def set_return_feature_value_handlers(
         self, features: List[tdf_mod.TrainingDatasetFeature]
@@ -1199,7 +1329,7 @@ class VectorServer:
         Keys relevant to vector_db are filtered out.
         """
         _logger.debug("Checking keys in entry are valid serving keys.")
-        for key in entry.keys():
+        for key in entry:
             if key not in self.valid_serving_keys:
                 raise exceptions.FeatureStoreException(
                     f"Provided key {key} is not a serving key. Required serving keys: {self.required_serving_keys}."
@@ -1208,9 +1338,7 @@ class VectorServer:
         _logger.debug("Checking entry has either all or none of composite serving keys")
         for composite_group in self.groups_of_composite_serving_keys.values():
             present_keys = [
-                True
-                if (sk_required in entry.keys() or sk_name in entry.keys())
-                else False
+                sk_required in entry or sk_name in entry
                 for (sk_required, sk_name) in composite_group
             ]
             if not all(present_keys) and any(present_keys):
@@ -1252,27 +1380,23 @@ class VectorServer:
         )
         missing_features_per_serving_keys = {}
         has_missing = False
+        passed_feature_names = set(passed_features.keys()) if passed_features else set()
+        if vector_db_features and len(vector_db_features) > 0:
+            _logger.debug(
+                "vector_db_features for pre-fetch missing : %s", vector_db_features
+            )
+            passed_feature_names = passed_feature_names.union(vector_db_features.keys())
         for sk_name, (
             sk_no_prefix,
             fetched_features,
         ) in self.per_serving_key_features.items():
-            passed_feature_names = (
-                set(passed_features.keys()) if passed_features else set()
-            )
-            if vector_db_features and len(vector_db_features) > 0:
-                _logger.debug(
-                    "vector_db_features for pre-fetch missing : %s", vector_db_features
-                )
-                passed_feature_names = passed_feature_names.union(
-                    vector_db_features.keys()
-                )
             neither_fetched_nor_passed = fetched_features.difference(
                 passed_feature_names
             )
             # if not present and all corresponding features are not passed via passed_features
             # or vector_db_features
             if (
-                sk_name not in entry.keys() and sk_no_prefix not in entry.keys()
+                sk_name not in entry and sk_no_prefix not in entry
             ) and not fetched_features.issubset(passed_feature_names):
                 _logger.debug(
                     f"Missing serving key {sk_name} and corresponding features {neither_fetched_nor_passed}."
@@ -1439,8 +1563,11 @@ class VectorServer:
 
     @property
     def feature_to_handle_if_sql(self) -> Set[str]:
-        # Unlike REST client, SQL client does not deserialize complex features
-        # however, it does convert timestamp to datetime obj
+        # Unlike REST client, the database does not deserialize complex features
+        # however, it does convert timestamp to datetime obj.
+        # The SQL client applies these handlers to the rows as it fetches them, the
+        # decoders pass already deserialized values through, so assembling the vector
+        # only decodes passed features and features retrieved from the vector database.
         if self._feature_to_handle_if_sql is None:
             self._feature_to_handle_if_sql = {
                 f.name
@@ -21,17 +21,16 @@ import math
 import numbers
 import os
 import random
-import re
 import sys
-import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from io import BytesIO
-from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -42,6 +41,7 @@ from typing import (
 from hsfs.core.type_systems import (
     cast_column_to_offline_type,
     cast_column_to_online_type,
+    cast_pandas_columns_to_offline_type,
 )
 
 
@@ -53,7 +53,9 @@ import hsfs
 import numpy as np
 import pandas as pd
 import polars as pl
+import polars.selectors as cs
 import pyarrow as pa
+import pyarrow.parquet as pq
 from botocore.response import StreamingBody
 from hopsworks_common import client
 from hopsworks_common.client.exceptions import FeatureStoreException
@@ -84,6 +86,7 @@ from hsfs.core.constants import (
     HAS_AIOMYSQL,
     HAS_ARROW,
     HAS_GREAT_EXPECTATIONS,
+    HAS_ORJSON,
     HAS_PANDAS,
     HAS_SQLALCHEMY,
 )
@@ -110,10 +113,30 @@ if HAS_SQLALCHEMY:
 if HAS_PANDAS:
     from hsfs.core.type_systems import convert_pandas_dtype_to_offline_type
 
+if HAS_ORJSON:
+    import orjson
+
 _logger = logging.getLogger(__name__)
 
 
 class Engine:
+    ONLINE_POOL_SIZE_ENV = "HSFS_ONLINE_POOL_SIZE"
+    MAX_CONCURRENT_FILE_READS = 8
+    KAFKA_BATCH_SIZE = 20000
+    # statistics data type per hopsworks type, None stands for nested or null types
+    PROFILE_DATA_TYPES = {
+        None: "String",
+        "timestamp": "String",
+        "date": "String",
+        "binary": "String",
+        "string": "String",
+        "float": "Fractional",
+        "double": "Fractional",
+        "int": "Integral",
+        "bigint": "Integral",
+        "boolean": "Boolean",
+    }
+
     def __init__(self) -> None:
         _logger.debug("Initialising Python Engine...")
         self._dataset_api: dataset_api.DatasetApi = dataset_api.DatasetApi()
@@ -127,6 +150,13 @@ class Engine:
 
         # cache the sql engine which contains the connection pool
         self._mysql_online_fs_engine = None
+        # the pool keeps 5 connections by default, allow sizing it for applications
+        # running many concurrent queries against the online feature store
+        self._mysql_online_fs_engine_options = (
+            {"pool_size": int(os.environ[self.ONLINE_POOL_SIZE_ENV])}
+            if self.ONLINE_POOL_SIZE_ENV in os.environ
+            else None
+        )
         _logger.info("Python Engine initialized.")
 
     def sql(
@@ -210,12 +240,24 @@ class Engine:
                     if "external" not in read_options
                     else read_options["external"]
                 ),
+                options=self._mysql_online_fs_engine_options,
             )
         with self._mysql_online_fs_engine.connect() as mysql_conn:
             if "sqlalchemy" in str(type(mysql_conn)):
                 sql_query = sql.text(sql_query)
             if dataframe_type.lower() == "polars":
                 result_df = pl.read_database(sql_query, mysql_conn)
+            elif "dtype_backend" in read_options:
+                # e.g. "pyarrow", to keep the result in arrow backed columns instead
+                # of numpy/object columns
+                if pd.__version__ < "2.0.0":
+                    raise FeatureStoreException(
+                        "Read option `dtype_backend` requires pandas 2.0.0 or higher, "
+                        f"installed version is {pd.__version__}."
+                    )
+                result_df = pd.read_sql(
+                    sql_query, mysql_conn, dtype_backend=read_options["dtype_backend"]
+                )
             else:
                 result_df = pd.read_sql(sql_query, mysql_conn)
             if schema:
@@ -239,7 +281,7 @@ class Engine:
             )
         elif storage_connector.type == storage_connector.S3:
             df_list = self._read_s3(
-                storage_connector, location, data_format, dataframe_type
+                storage_connector, location, data_format, dataframe_type, read_options
             )
         else:
             raise NotImplementedError(
@@ -260,18 +302,48 @@ class Engine:
                 return df_list[0]
         else:
             return self._return_dataframe_type(
-                pd.concat(df_list, ignore_index=True), dataframe_type=dataframe_type
+                self._concat_to_pandas(df_list), dataframe_type=dataframe_type
             )
 
-    def _read_pandas(self, data_format: str, obj: Any) -> pd.DataFrame:
+    @staticmethod
+    def _concat_to_pandas(
+        df_list: List[Union[pd.DataFrame, pa.Table]],
+    ) -> pd.DataFrame:
+        if len(df_list) > 0 and all(isinstance(df, pa.Table) for df in df_list):
+            try:
+                # concatenating arrow tables does not copy the data, convert the
+                # result once instead of converting every file and copying all of
+                # them again in pd.concat
+                df = pa.concat_tables(df_list).to_pandas()
+                df.index = pd.RangeIndex(len(df))
+                return df
+            except pa.ArrowInvalid:
+                # files with different schemas, let pandas reconcile the dtypes
+                _logger.debug("Could not concatenate arrow tables, using pandas.")
+        return pd.concat(
+            [df.to_pandas() if isinstance(df, pa.Table) else df for df in df_list],
+            ignore_index=True,
+        )
+
+    def _read_pandas(
+        self,
+        data_format: str,
+        obj: Any,
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> pd.DataFrame:
         if data_format.lower() == "csv":
-            return pd.read_csv(obj)
+            return pd.read_csv(obj, usecols=columns)
         elif data_format.lower() == "tsv":
-            return pd.read_csv(obj, sep="\t")
-        elif data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
-            return pd.read_parquet(BytesIO(obj.read()))
+            return pd.read_csv(obj, sep="\t", usecols=columns)
         elif data_format.lower() == "parquet":
-            return pd.read_parquet(obj)
+            if isinstance(obj, StreamingBody):
+                # parquet needs a seekable file, let arrow read the downloaded object
+                # in place instead of through a python file object
+                obj = pa.BufferReader(obj.read())
+            if batch_size is not None:
+                return self._read_parquet_batches(obj, columns, batch_size).to_pandas()
+            return pd.read_parquet(obj, columns=columns)
         else:
             raise TypeError(
                 "{} training dataset format is not supported to read as pandas dataframe.".format(
@@ -280,16 +352,26 @@ class Engine:
             )
 
     def _read_polars(
-        self, data_format: Literal["csv", "tsv", "parquet"], obj: Any
+        self,
+        data_format: Literal["csv", "tsv", "parquet"],
+        obj: Any,
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
     ) -> pl.DataFrame:
         if data_format.lower() == "csv":
-            return pl.read_csv(obj)
+            return pl.read_csv(obj, columns=columns)
         elif data_format.lower() == "tsv":
-            return pl.read_csv(obj, separator="\t")
-        elif data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
-            return pl.read_parquet(BytesIO(obj.read()), use_pyarrow=True)
+            return pl.read_csv(obj, separator="\t", columns=columns)
         elif data_format.lower() == "parquet":
-            return pl.read_parquet(obj, use_pyarrow=True)
+            if isinstance(obj, StreamingBody):
+                # parquet needs a seekable file, let arrow read the downloaded object
+                # in place instead of through a python file object
+                obj = pa.BufferReader(obj.read())
+            if batch_size is not None:
+                return pl.from_arrow(
+                    self._read_parquet_batches(obj, columns, batch_size)
+                )
+            return pl.read_parquet(obj, columns=columns, use_pyarrow=True)
         else:
             raise TypeError(
                 "{} training dataset format is not supported to read as polars dataframe.".format(
@@ -297,8 +379,22 @@ class Engine:
                 )
             )
 
+    @staticmethod
+    def _read_parquet_batches(
+        source: Any, columns: Optional[List[str]], batch_size: int
+    ) -> pa.Table:
+        # decode the file in record batches of the requested number of rows
+        parquet_file = pq.ParquetFile(source)
+        batches = list(
+            parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+        )
+        if not batches:
+            return parquet_file.read(columns=columns)
+        return pa.Table.from_batches(batches)
+
     def _is_metadata_file(self, path):
-        return Path(path).stem.startswith("_")
+        # plain string handling, building a Path for each listed file is costly
+        return os.path.basename(path.rstrip("/")).startswith("_")
 
     def _read_hopsfs(
         self,
@@ -322,41 +418,83 @@ class Engine:
     ) -> List[Union[pd.DataFrame, pl.DataFrame]]:
         total_count = 10000
         offset = 0
-        df_list = []
         if read_options is None:
             read_options = {}
+        # only decode the requested columns, parquet files are read column-wise
+        columns = read_options.get("columns")
+        # resolve the arrow flight client once, so the worker threads neither race
+        # on creating it nor repeat the availability check for every file
+        flight_client = (
+            arrow_flight_client.get_instance()
+            if arrow_flight_client.is_data_format_supported(data_format, read_options)
+            else None
+        )
 
-        while offset < total_count:
-            total_count, inode_list = self._dataset_api.list_files(
-                location, offset, 100
+        futures = []
+        # download and decode the files concurrently, and keep listing the next
+        # page of files while the files of the previous page are being read
+        with ThreadPoolExecutor(
+            max_workers=read_options.get(
+                "max_concurrent_reads", self.MAX_CONCURRENT_FILE_READS
             )
+        ) as executor:
+            while offset < total_count:
+                total_count, inode_list = self._dataset_api.list_files(
+                    location, offset, 100
+                )
 
-            for inode in inode_list:
-                if not self._is_metadata_file(inode.path):
-                    if arrow_flight_client.is_data_format_supported(
-                        data_format, read_options
-                    ):
-                        arrow_flight_config = read_options.get("arrow_flight_config")
-                        df = arrow_flight_client.get_instance().read_path(
-                            inode.path,
-                            arrow_flight_config,
-                            dataframe_type=dataframe_type,
-                        )
-                    else:
-                        content_stream = self._dataset_api.read_content(inode.path)
-                        if dataframe_type.lower() == "polars":
-                            df = self._read_polars(
-                                data_format, BytesIO(content_stream.content)
-                            )
-                        else:
-                            df = self._read_pandas(
-                                data_format, BytesIO(content_stream.content)
+                for inode in inode_list:
+                    if not self._is_metadata_file(inode.path):
+                        futures.append(
+                            executor.submit(
+                                self._read_hopsfs_remote_file,
+                                inode.path,
+                                data_format,
+                                read_options,
+                                columns,
+                                dataframe_type,
+                                flight_client,
                             )
+                        )
+                    offset += 1
 
-                    df_list.append(df)
-                offset += 1
+        # results are collected in listing order
+        return [future.result() for future in futures]
 
-        return df_list
+    def _read_hopsfs_remote_file(
+        self,
+        path: str,
+        data_format: str,
+        read_options: Dict[str, Any],
+        columns: Optional[List[str]],
+        dataframe_type: str,
+        flight_client: Optional[arrow_flight_client.ArrowFlightClient] = None,
+    ) -> Union[pd.DataFrame, pl.DataFrame]:
+        if flight_client is not None:
+            arrow_flight_config = read_options.get("arrow_flight_config")
+            df = flight_client.read_path(
+                path,
+                arrow_flight_config,
+                # pandas results are kept as arrow tables until all files are read,
+                # `read` converts them to pandas at once
+                dataframe_type=(
+                    "polars" if dataframe_type.lower() == "polars" else "pyarrow"
+                ),
+            )
+            if columns is not None:
+                df = df.select(columns)
+            return df
+
+        content_stream = self._dataset_api.read_content(path)
+        batch_size = read_options.get("arrow_batch_size")
+        if dataframe_type.lower() == "polars":
+            return self._read_polars(
+                data_format, BytesIO(content_stream.content), columns, batch_size
+            )
+        else:
+            return self._read_pandas(
+                data_format, BytesIO(content_stream.content), columns, batch_size
+            )
 
     def _read_s3(
         self,
@@ -364,7 +502,13 @@ class Engine:
         location: str,
         data_format: str,
         dataframe_type: str = "default",
+        read_options: Optional[Dict[str, Any]] = None,
     ) -> List[Union[pd.DataFrame, pl.DataFrame]]:
+        if read_options is None:
+            read_options = {}
+        columns = read_options.get("columns")
+        batch_size = read_options.get("arrow_batch_size")
+
         # get key prefix
         path_parts = location.replace("s3://", "").split("/")
         _ = path_parts.pop(0)  # pop first element -> bucket
@@ -385,34 +529,37 @@ class Engine:
                 aws_secret_access_key=storage_connector.secret_key,
             )
 
-        df_list = []
-        object_list = {"is_truncated": True}
-        while object_list.get("is_truncated", False):
-            if "NextContinuationToken" in object_list:
-                object_list = s3.list_objects_v2(
-                    Bucket=storage_connector.bucket,
-                    Prefix=prefix,
-                    MaxKeys=1000,
-                    ContinuationToken=object_list["NextContinuationToken"],
-                )
+        def read_object(key: str) -> Union[pd.DataFrame, pl.DataFrame]:
+            obj = s3.get_object(
+                Bucket=storage_connector.bucket,
+                Key=key,
+            )
+            if dataframe_type.lower() == "polars":
+                return self._read_polars(data_format, obj["Body"], columns, batch_size)
             else:
-                object_list = s3.list_objects_v2(
-                    Bucket=storage_connector.bucket,
-                    Prefix=prefix,
-                    MaxKeys=1000,
-                )
+                return self._read_pandas(data_format, obj["Body"], columns, batch_size)
 
-            for obj in object_list["Contents"]:
-                if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0:
-                    obj = s3.get_object(
-                        Bucket=storage_connector.bucket,
-                        Key=obj["Key"],
-                    )
-                    if dataframe_type.lower() == "polars":
-                        df_list.append(self._read_polars(data_format, obj["Body"]))
-                    else:
-                        df_list.append(self._read_pandas(data_format, obj["Body"]))
-        return df_list
+        futures = []
+        # download and decode the objects concurrently, boto3 clients are thread safe
+        with ThreadPoolExecutor(
+            max_workers=read_options.get(
+                "max_concurrent_reads", self.MAX_CONCURRENT_FILE_READS
+            )
+        ) as executor:
+            # the paginator fetches the next page of keys only once the objects
+            # of the current page have been scheduled
+            pages = s3.get_paginator("list_objects_v2").paginate(
+                Bucket=storage_connector.bucket,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": 1000},
+            )
+            for page in pages:
+                for obj in page.get("Contents", []):
+                    if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0:
+                        futures.append(executor.submit(read_object, obj["Key"]))
+
+        # results are collected in listing order
+        return [future.result() for future in futures]
 
     def read_options(
         self, data_format: Optional[str], provided_options: Optional[Dict[str, Any]]
@@ -514,61 +661,55 @@ class Engine:
         exact_uniqueness: bool = True,
     ) -> str:
         # TODO: add statistics for correlations, histograms and exact_uniqueness
-        if isinstance(df, pl.DataFrame) or isinstance(df, pl.dataframe.frame.DataFrame):
-            arrow_schema = df.to_arrow().schema
+        is_polars = isinstance(df, pl.DataFrame) or isinstance(
+            df, pl.dataframe.frame.DataFrame
+        )
+        if is_polars:
+            # polars dtypes do not depend on the data, so an empty slice is enough
+            arrow_schema = df.head(0).to_arrow().schema
         else:
             arrow_schema = pa.Schema.from_pandas(df, preserve_index=False)
 
-        # parse timestamp columns to string columns
-        for field in arrow_schema:
-            if not (
-                pa.types.is_null(field.type)
-                or pa.types.is_list(field.type)
-                or pa.types.is_large_list(field.type)
-                or pa.types.is_struct(field.type)
-            ) and PYARROW_HOPSWORKS_DTYPE_MAPPING[field.type] in ["timestamp", "date"]:
-                if isinstance(df, pl.DataFrame) or isinstance(
-                    df, pl.dataframe.frame.DataFrame
-                ):
-                    df = df.with_columns(pl.col(field.name).cast(pl.String))
-                else:
-                    df[field.name] = df[field.name].astype(str)
+        # resolve the hopsworks type of each column once, nested types are not mapped
+        hopsworks_types = {
+            field.name: self._get_profile_hopsworks_type(field.type)
+            for field in arrow_schema
+        }
+
+        # timestamp and date columns are profiled as strings, for which only the
+        # count is reported, so they are counted directly instead of described
+        datetime_cols = {
+            col
+            for col, hopsworks_type in hopsworks_types.items()
+            if hopsworks_type in ["timestamp", "date"]
+        }
 
         if relevant_columns is None or len(relevant_columns) == 0:
-            stats = df.describe().to_dict()
             relevant_columns = df.columns
-        else:
-            target_cols = [col for col in df.columns if col in relevant_columns]
-            stats = df[target_cols].describe().to_dict()
+        target_cols = [
+            col
+            for col in df.columns
+            if col in relevant_columns and col not in datetime_cols
+        ]
+        stats = df[target_cols].describe().to_dict() if target_cols else {}
+        for col in datetime_cols.intersection(relevant_columns):
+            stats[col] = {"count": int(df[col].count())}
         # df.describe() does not compute stats for all col types (e.g., string)
-        # we need to compute stats for the rest of the cols iteratively
-        missing_cols = list(set(relevant_columns) - set(stats.keys()))
-        for col in missing_cols:
-            stats[col] = df[col].describe().to_dict()
+        # we need to compute stats for the rest of the cols in a single call
+        missing_cols = [col for col in relevant_columns if col not in stats]
+        if missing_cols:
+            if is_polars:
+                missing_stats = df[missing_cols].describe().to_dict()
+            else:
+                missing_stats = df[missing_cols].describe(include="all").to_dict()
+            stats.update(missing_stats)
         final_stats = []
         for col in relevant_columns:
-            if isinstance(df, pl.DataFrame) or isinstance(
-                df, pl.dataframe.frame.DataFrame
-            ):
+            if is_polars and col not in datetime_cols:
                 stats[col] = dict(zip(stats["statistic"], stats[col]))
             # set data type
-            arrow_type = arrow_schema.field(col).type
-            if (
-                pa.types.is_null(arrow_type)
-                or pa.types.is_list(arrow_type)
-                or pa.types.is_large_list(arrow_type)
-                or pa.types.is_struct(arrow_type)
-                or PYARROW_HOPSWORKS_DTYPE_MAPPING[arrow_type]
-                in ["timestamp", "date", "binary", "string"]
-            ):
-                dataType = "String"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING[arrow_type] in ["float", "double"]:
-                dataType = "Fractional"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING[arrow_type] in ["int", "bigint"]:
-                dataType = "Integral"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING[arrow_type] == "boolean":
-                dataType = "Boolean"
-            else:
+            dataType = self.PROFILE_DATA_TYPES.get(hopsworks_types[col])
+            if dataType is None:
                 print(
                     "Data type could not be inferred for column '"
                     + col.split(".")[-1]
@@ -584,10 +725,25 @@ class Engine:
 
             final_stats.append(stat)
 
+        if HAS_ORJSON:
+            return orjson.dumps(
+                {"columns": final_stats}, option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
         return json.dumps(
             {"columns": final_stats},
         )
 
+    @staticmethod
+    def _get_profile_hopsworks_type(arrow_type: pa.DataType) -> Optional[str]:
+        if (
+            pa.types.is_null(arrow_type)
+            or pa.types.is_list(arrow_type)
+            or pa.types.is_large_list(arrow_type)
+            or pa.types.is_struct(arrow_type)
+        ):
+            return None
+        return PYARROW_HOPSWORKS_DTYPE_MAPPING[arrow_type]
+
     def _convert_pandas_statistics(
         self, stat: Dict[str, Any], dataType: str
     ) -> Dict[str, Any]:
@@ -661,7 +817,7 @@ class Engine:
             or isinstance(dataframe, pl.dataframe.frame.DataFrame)
         ):
             upper_case_features = [
-                col for col in dataframe.columns if any(re.finditer("[A-Z]", col))
+                col for col in dataframe.columns if col != col.lower()
             ]
             space_features = [col for col in dataframe.columns if " " in col]
 
@@ -691,20 +847,26 @@ class Engine:
                     util.FeatureGroupWarning,
                     stacklevel=1,
                 )
+            # sanitize each distinct column name only once
+            sanitized_names = {
+                col: util.autofix_feature_name(col)
+                for col in dict.fromkeys(dataframe_copy.columns)
+            }
             dataframe_copy.columns = [
-                util.autofix_feature_name(x) for x in dataframe_copy.columns
+                sanitized_names[col] for col in dataframe_copy.columns
             ]
 
             # convert timestamps with timezone to UTC
-            for col in dataframe_copy.columns:
-                if isinstance(
-                    dataframe_copy[col].dtype, pd.core.dtypes.dtypes.DatetimeTZDtype
-                ):
-                    dataframe_copy[col] = dataframe_copy[col].dt.tz_convert(None)
-                elif isinstance(dataframe_copy[col].dtype, pl.Datetime):
-                    dataframe_copy = dataframe_copy.with_columns(
-                        pl.col(col).dt.replace_time_zone(None)
+            if isinstance(dataframe_copy, pd.DataFrame):
+                tz_columns = dataframe_copy.select_dtypes(include="datetimetz").columns
+                if len(tz_columns) > 0:
+                    dataframe_copy[tz_columns] = dataframe_copy[tz_columns].apply(
+                        lambda column: column.dt.tz_convert(None)
                     )
+            else:
+                dataframe_copy = dataframe_copy.with_columns(
+                    cs.datetime().dt.replace_time_zone(None)
+                )
             return dataframe_copy
         elif dataframe == "spine":
             return None
@@ -729,13 +891,12 @@ class Engine:
         elif isinstance(dataframe, pl.DataFrame) or isinstance(
             dataframe, pl.dataframe.frame.DataFrame
         ):
-            arrow_schema = dataframe.to_arrow().schema
+            # polars dtypes do not depend on the data, so an empty slice is enough
+            arrow_schema = dataframe.head(0).to_arrow().schema
         features = []
-        for i in range(len(arrow_schema.names)):
-            feat_name = arrow_schema.names[i]
+        for feat_name, pd_type in zip(arrow_schema.names, arrow_schema.types):
             name = util.autofix_feature_name(feat_name)
             try:
-                pd_type = arrow_schema.field(feat_name).type
                 if pa.types.is_null(pd_type) and feature_type_map.get(name):
                     converted_type = feature_type_map.get(name)
                 else:
@@ -890,7 +1051,7 @@ class Engine:
     ]:
         if labels:
             labels_df = df[labels]
-            df_new = df.drop(columns=labels)
+            df_new = self.drop_columns(df, labels)
             return (
                 self._return_dataframe_type(df_new, dataframe_type),
                 self._return_dataframe_type(labels_df, dataframe_type),
@@ -901,6 +1062,15 @@ class Engine:
     def drop_columns(
         self, df: Union[pd.DataFrame, pl.DataFrame], drop_cols: List[str]
     ) -> Union[pd.DataFrame, pl.DataFrame]:
+        if isinstance(df, pd.DataFrame):
+            # deleting the columns from a shallow copy keeps the data of the remaining
+            # columns shared with df, while drop would copy all of them
+            df_new = df.copy(deep=False)
+            for col in dict.fromkeys(
+                [drop_cols] if isinstance(drop_cols, str) else drop_cols
+            ):
+                del df_new[col]
+            return df_new
         return df.drop(columns=drop_cols)
 
     def _prepare_transform_split_df(
@@ -926,36 +1096,27 @@ class Engine:
         # Raises
             `ValueError`: If the training dataset statistics could not be retrieved.
         """
-        if (
+        time_series_split = (
             training_dataset_obj.splits[0].split_type
             == TrainingDatasetSplit.TIME_SERIES_SPLIT
-        ):
+        )
+        drop_event_time = False
+        if time_series_split:
             event_time = query_obj._left_feature_group.event_time
             if event_time not in [_feature.name for _feature in query_obj.features]:
                 query_obj.append_feature(
                     query_obj._left_feature_group.__getattr__(event_time)
                 )
-                result_dfs = self._time_series_split(
-                    query_obj.read(
-                        read_options=read_option, dataframe_type=dataframe_type
-                    ),
-                    training_dataset_obj,
-                    event_time,
-                    drop_event_time=True,
-                )
-            else:
-                result_dfs = self._time_series_split(
-                    query_obj.read(
-                        read_options=read_option, dataframe_type=dataframe_type
-                    ),
-                    training_dataset_obj,
-                    event_time,
-                )
-        else:
-            result_dfs = self._random_split(
-                query_obj.read(read_options=read_option, dataframe_type=dataframe_type),
-                training_dataset_obj,
+                drop_event_time = True
+
+        # the query is read once, whichever way it is split
+        df = query_obj.read(read_options=read_option, dataframe_type=dataframe_type)
+        if time_series_split:
+            result_dfs = self._time_series_split(
+                df, training_dataset_obj, event_time, drop_event_time=drop_event_time
             )
+        else:
+            result_dfs = self._random_split(df, training_dataset_obj)
 
         # TODO : Currently statistics always computed since in memory training dataset retrieved is not consistent
         # if training_dataset_version is None:
@@ -966,12 +1127,31 @@ class Engine:
         #    transformation_function_engine.TransformationFunctionEngine.get_and_set_feature_statistics(
         #        training_dataset_obj, feature_view_obj, training_dataset_version
         #    )
-        # and the apply them
-        for split_name in result_dfs:
-            result_dfs[split_name] = self._apply_transformation_function(
-                feature_view_obj.transformation_functions,
-                result_dfs.get(split_name),
-            )
+        # and the apply them, the splits are independent so they are transformed concurrently
+        max_workers = (read_option or {}).get(
+            "max_concurrent_transformations",
+            min(len(result_dfs), os.cpu_count() or 1),
+        )
+        if result_dfs and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    split_name: executor.submit(
+                        self._apply_transformation_function,
+                        feature_view_obj.transformation_functions,
+                        split_df,
+                    )
+                    for split_name, split_df in result_dfs.items()
+                }
+                result_dfs = {
+                    split_name: future.result()
+                    for split_name, future in futures.items()
+                }
+        else:
+            for split_name in result_dfs:
+                result_dfs[split_name] = self._apply_transformation_function(
+                    feature_view_obj.transformation_functions,
+                    result_dfs.get(split_name),
+                )
 
         return result_dfs
 
@@ -980,37 +1160,34 @@ class Engine:
         df: Union[pd.DataFrame, pl.DataFrame],
         training_dataset_obj: TrainingDataset,
     ) -> Dict[str, Union[pd.DataFrame, pl.DataFrame]]:
-        split_column = f"_SPLIT_INDEX_{uuid.uuid1()}"
         result_dfs = {}
         splits = training_dataset_obj.splits
+        percentages = [split.percentage for split in splits]
         if (
-            not math.isclose(
-                sum([split.percentage for split in splits]), 1
-            )  # relative tolerance = 1e-09
-            or sum([split.percentage > 1 or split.percentage < 0 for split in splits])
-            > 1
+            not math.isclose(sum(percentages), 1)  # relative tolerance = 1e-09
+            or sum(p > 1 or p < 0 for p in percentages) > 1
         ):
             raise ValueError(
                 "Sum of split ratios should be 1 and each values should be in range (0, 1)"
             )
 
         df_size = len(df)
-        groups = []
-        for i, split in enumerate(splits):
-            groups += [i] * int(df_size * split.percentage)
-        groups += [len(splits) - 1] * (df_size - len(groups))
-        random.shuffle(groups)
-        if isinstance(df, pl.DataFrame) or isinstance(df, pl.dataframe.frame.DataFrame):
-            df = df.with_columns(pl.Series(name=split_column, values=groups))
-        else:
-            df[split_column] = groups
+        counts = [int(df_size * percentage) for percentage in percentages]
+        counts[-1] += df_size - sum(counts)
+        groups = np.repeat(np.arange(len(splits)), counts)
+        # seed from the random module, so that random.seed keeps splits reproducible
+        np.random.default_rng(random.getrandbits(64)).shuffle(groups)
+        # positions of the rows of each split, in their original order
+        positions = np.argsort(groups, kind="stable")
+        offsets = np.cumsum([0] + counts)
         for i, split in enumerate(splits):
+            split_positions = positions[offsets[i] : offsets[i + 1]]
             if isinstance(df, pl.DataFrame) or isinstance(
                 df, pl.dataframe.frame.DataFrame
             ):
-                split_df = df.filter(pl.col(split_column) == i).drop(split_column)
+                split_df = df[split_positions]
             else:
-                split_df = df[df[split_column] == i].drop(split_column, axis=1)
+                split_df = df.iloc[split_positions]
             result_dfs[split.name] = split_df
         return result_dfs
 
@@ -1022,16 +1199,20 @@ class Engine:
         drop_event_time: bool = False,
     ) -> Dict[str, Union[pd.DataFrame, pl.DataFrame]]:
         result_dfs = {}
+        # convert the event times once and reuse them for the mask of every split
+        timestamps = self._convert_event_time_to_timestamps(df[event_time])
         for split in training_dataset_obj.splits:
             if len(df[event_time]) > 0:
-                result_df = df[
-                    [
-                        split.start_time
-                        <= util.convert_event_time_to_timestamp(t)
-                        < split.end_time
-                        for t in df[event_time]
-                    ]
-                ]
+                mask = np.asarray(
+                    (split.start_time <= timestamps) & (timestamps < split.end_time),
+                    dtype=bool,
+                )
+                if isinstance(df, pl.DataFrame) or isinstance(
+                    df, pl.dataframe.frame.DataFrame
+                ):
+                    result_df = df.filter(pl.Series(mask))
+                else:
+                    result_df = df[mask]
             else:
                 # if df[event_time] is empty, it returns an empty dataframe
                 result_df = df
@@ -1040,6 +1221,35 @@ class Engine:
             result_dfs[split.name] = result_df
         return result_dfs
 
+    @staticmethod
+    def _convert_event_time_to_timestamps(
+        event_times: Union[pd.Series, pl.Series],
+    ) -> np.ndarray:
+        # unix epoch milliseconds of all event times, matching
+        # util.convert_event_time_to_timestamp for a single event time
+        if isinstance(event_times, pl.Series):
+            if isinstance(event_times.dtype, (pl.Datetime, pl.Date)):
+                # dates are taken at midnight UTC
+                return event_times.dt.epoch(time_unit="ms").to_numpy()
+            values = event_times.to_numpy()
+        elif pd.api.types.is_datetime64_any_dtype(event_times):
+            # naive datetimes are treated as UTC
+            return (
+                (pd.to_datetime(event_times, utc=True) - pd.Timestamp(0, tz="UTC"))
+                // pd.Timedelta(milliseconds=1)
+            ).to_numpy()
+        else:
+            values = event_times.to_numpy()
+
+        if np.issubdtype(values.dtype, np.integer):
+            # jdbc supports timestamp precision up to second only
+            return np.where(values < 10**10, values * 1000, values)
+        if np.issubdtype(values.dtype, np.datetime64):
+            return values.astype("datetime64[ms]").astype(np.int64)
+        return np.array(
+            [util.convert_event_time_to_timestamp(t) for t in values], dtype=object
+        )
+
     def write_training_dataset(
         self,
         training_dataset: TrainingDataset,
@@ -1122,12 +1332,28 @@ class Engine:
         if dataframe_type.lower() in ["default", "pandas"]:
             return dataframe
         if dataframe_type.lower() == "polars":
-            if not (
+            if isinstance(dataframe, pd.DataFrame):
+                # going through an arrow table shares the buffers of arrow backed
+                # columns and avoids the per column conversion of pl.from_pandas
+                return pl.from_arrow(
+                    pa.Table.from_pandas(dataframe, preserve_index=False)
+                )
+            elif not (
                 isinstance(dataframe, pl.DataFrame) or isinstance(dataframe, pl.Series)
             ):
                 return pl.from_pandas(dataframe)
             else:
                 return dataframe
+        if isinstance(dataframe, (pl.DataFrame, pl.Series)):
+            # polars dataframes have no `values`, convert them to numpy directly
+            if dataframe_type.lower() == "numpy":
+                return dataframe.to_numpy()
+            if dataframe_type.lower() == "python":
+                # rows keeps python types, e.g. datetimes, that numpy would
+                # convert to integers
+                if isinstance(dataframe, pl.Series):
+                    return dataframe.to_list()
+                return [list(row) for row in dataframe.rows()]
         if dataframe_type.lower() == "numpy":
             return dataframe.values
         if dataframe_type.lower() == "python":
@@ -1197,10 +1423,19 @@ class Engine:
             content_stream = self._dataset_api.read_content(
                 file, util.get_dataset_type(file)
             )
-            bytesio_object = BytesIO(content_stream.content)
-            # Write the stuff
-            with open(local_file, "wb") as f:
-                f.write(bytesio_object.getbuffer())
+            # Stream the content to a temporary file and move it in place once
+            # complete, so an interrupted download is not picked up on the next call
+            tmp_file = local_file + ".tmp"
+            try:
+                with open(tmp_file, "wb") as f:
+                    for chunk in content_stream.iter_content(
+                        chunk_size=self._dataset_api.DEFAULT_FLOW_CHUNK_SIZE
+                    ):
+                        f.write(chunk)
+                os.replace(tmp_file, local_file)
+            finally:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
         return local_file
 
     def _apply_transformation_function(
@@ -1232,32 +1467,50 @@ class Engine:
             else:
                 dataset = dataset.to_pandas(use_pyarrow_extension_array=False)
 
+        # outputs of the transformation functions are collected and joined to the
+        # dataset once, a later transformation function can still use them as input
+        udf_outputs = []
+        transformed_features = {}
         for tf in transformation_functions:
             hopsworks_udf = tf.hopsworks_udf
-            missing_features = set(hopsworks_udf.transformation_features) - set(
-                dataset.columns
+            transformation_features = hopsworks_udf.transformation_features
+            missing_features = (
+                set(transformation_features)
+                - set(dataset.columns)
+                - set(transformed_features)
             )
             if missing_features:
                 raise FeatureStoreException(
                     f"Features {missing_features} specified in the transformation function '{hopsworks_udf.function_name}' are not present in the feature view. Please specify the feature required correctly."
                 )
-            if tf.hopsworks_udf.dropped_features:
-                dropped_features.update(tf.hopsworks_udf.dropped_features)
-            dataset = pd.concat(
-                [
-                    dataset.reset_index(drop=True),
-                    tf.hopsworks_udf.get_udf()(
-                        *(
-                            [
-                                dataset[feature]
-                                for feature in tf.hopsworks_udf.transformation_features
-                            ]
-                        )
-                    ).reset_index(drop=True),
-                ],
-                axis=1,
-            )
-        dataset = dataset.drop(dropped_features, axis=1)
+            if hopsworks_udf.dropped_features:
+                dropped_features.update(hopsworks_udf.dropped_features)
+            udf_output = hopsworks_udf.get_udf()(
+                *(
+                    [
+                        transformed_features[feature]
+                        if feature in transformed_features
+                        else dataset[feature].reset_index(drop=True)
+                        for feature in transformation_features
+                    ]
+                )
+            ).reset_index(drop=True)
+            udf_outputs.append(udf_output)
+            if isinstance(udf_output, pd.Series):
+                transformed_features[udf_output.name] = udf_output
+            else:
+                transformed_features.update(udf_output.items())
+        if udf_outputs:
+            # only the index of the dataset is reset here, its data is copied once
+            # by the concatenation
+            dataset = dataset.copy(deep=False)
+            dataset.index = pd.RangeIndex(len(dataset))
+            dataset = pd.concat([dataset] + udf_outputs, axis=1)
+            # the concatenated dataframe is a new copy, drop columns in place
+            for dropped_feature in dropped_features:
+                del dataset[dropped_feature]
+        else:
+            dataset = dataset.drop(dropped_features, axis=1)
         return dataset
 
     @staticmethod
@@ -1266,6 +1519,52 @@ class Engine:
     ) -> np.ndarray:
         return feature_dataframe[feature_name].unique()
 
+    @staticmethod
+    def _get_kafka_rows(
+        dataframe: pd.DataFrame, batch_size: int = KAFKA_BATCH_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        # the dataframe is converted in batches of rows, so that only one batch is
+        # held as python objects at a time
+        for start in range(0, len(dataframe), batch_size):
+            yield from Engine._get_kafka_batch_rows(
+                dataframe.iloc[start : start + batch_size]
+            )
+
+    @staticmethod
+    def _get_kafka_batch_rows(dataframe: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+        # for avro to be able to serialize the rows, they need to be python data types,
+        # the conversion is chosen once per column based on its dtype
+        columns = list(dataframe.columns)
+        column_values = []
+        for i, dtype in enumerate(dataframe.dtypes):
+            column = dataframe.iloc[:, i]
+            if isinstance(dtype, np.dtype) and dtype.kind in "iufb":
+                # numpy numeric columns are converted to python scalars
+                column_values.append(column.tolist())
+            elif isinstance(dtype, pd.DatetimeTZDtype) or (
+                isinstance(dtype, np.dtype) and dtype.kind == "M"
+            ):
+                # timezone naive timestamps are interpreted as UTC
+                if column.dt.tz is None:
+                    column = column.dt.tz_localize("UTC")
+                column_values.append(column.array.to_pydatetime())
+            else:
+                # the other columns can hold timestamps, arrays or missing values
+                column_values.append(map(Engine._to_kafka_value, column.tolist()))
+        return (dict(zip(columns, values)) for values in zip(*column_values))
+
+    @staticmethod
+    def _to_kafka_value(value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        if isinstance(value, datetime) and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        if isinstance(value, pd._libs.missing.NAType):
+            return None
+        return value
+
     def _write_dataframe_kafka(
         self,
         feature_group: Union[FeatureGroup, ExternalFeatureGroup],
@@ -1294,42 +1593,30 @@ class Engine:
         )
 
         if isinstance(dataframe, pd.DataFrame):
-            row_iterator = dataframe.itertuples(index=False)
+            row_iterator = self._get_kafka_rows(
+                dataframe,
+                offline_write_options.get("kafka_batch_size", self.KAFKA_BATCH_SIZE),
+            )
         else:
             row_iterator = dataframe.iter_rows(named=True)
 
+        # the same buffer is reused to encode every row
+        outf = BytesIO()
+        primary_key = sorted(feature_group.primary_key)
+
         # loop over rows
         for row in row_iterator:
-            if isinstance(dataframe, pd.DataFrame):
-                # itertuples returns Python NamedTyple, to be able to serialize it using
-                # avro, create copy of row only by converting to dict, which preserves datatypes
-                row = row._asdict()
-
-                # transform special data types
-                # here we might need to handle also timestamps and other complex types
-                # possible optimizaiton: make it based on type so we don't need to loop over
-                # all keys in the row
-                for k in row.keys():
-                    # for avro to be able to serialize them, they need to be python data types
-                    if isinstance(row[k], np.ndarray):
-                        row[k] = row[k].tolist()
-                    if isinstance(row[k], pd.Timestamp):
-                        row[k] = row[k].to_pydatetime()
-                    if isinstance(row[k], datetime) and row[k].tzinfo is None:
-                        row[k] = row[k].replace(tzinfo=timezone.utc)
-                    if isinstance(row[k], pd._libs.missing.NAType):
-                        row[k] = None
-
             # encode complex features
             row = kafka_engine.encode_complex_features(feature_writers, row)
 
             # encode feature row
-            with BytesIO() as outf:
-                writer(row, outf)
-                encoded_row = outf.getvalue()
+            outf.seek(0)
+            outf.truncate()
+            writer(row, outf)
+            encoded_row = outf.getvalue()
 
             # assemble key
-            key = "".join([str(row[pk]) for pk in sorted(feature_group.primary_key)])
+            key = "".join([str(row[pk]) for pk in primary_key])
 
             kafka_engine.kafka_produce(
                 producer=producer,
@@ -1406,10 +1693,15 @@ class Engine:
     def cast_columns(
         df: pd.DataFrame, schema: List[feature.Feature], online: bool = False
     ) -> pd.DataFrame:
-        for _feat in schema:
-            if not online:
+        if not online:
+            if isinstance(df, pd.DataFrame):
+                return cast_pandas_columns_to_offline_type(
+                    df, {_feat.name: _feat.type for _feat in schema}
+                )
+            for _feat in schema:
                 df[_feat.name] = cast_column_to_offline_type(df[_feat.name], _feat.type)
-            else:
+        else:
+            for _feat in schema:
                 df[_feat.name] = cast_column_to_online_type(
                     df[_feat.name], _feat.online_type
                 )
@@ -1479,31 +1771,68 @@ class Engine:
             predictions = Engine._convert_feature_log_to_df(
                 predictions, [f.name for f in td_predictions]
             )
-            for f in td_predictions:
-                predictions[f.name] = cast_column_to_offline_type(
-                    predictions[f.name], f.type
-                )
-            if not set(predictions.columns).intersection(set(features.columns)):
-                features = pd.concat([features, predictions], axis=1)
-
-        features[td_col_name] = pd.Series(
-            [training_dataset_version for _ in range(len(features))]
-        )
-        # _cast_column_to_offline_type cannot cast string type
-        features[model_col_name] = pd.Series(
-            [
+            predictions = cast_pandas_columns_to_offline_type(
+                predictions, {f.name: f.type for f in td_predictions}
+            )
+            if predictions.columns.intersection(features.columns).empty:
+                if len(predictions) == len(features):
+                    # predictions are logged row by row with the features, whatever
+                    # index either of them has
+                    predictions.index = features.index
+                else:
+                    features = pd.concat([features, predictions], axis=1)
+                    predictions = None
+            else:
+                predictions = None
+
+        # the logging columns are built as series on the index of features, so that
+        # they align also when the logged dataframe does not have a default range
+        # index, and are only assembled with the features in the final selection
+        log_columns = {
+            td_col_name: pd.Series(
+                np.full(len(features), training_dataset_version),
+                index=features.index,
+            ),
+            # _cast_column_to_offline_type cannot cast string type
+            model_col_name: pd.Series(
                 FeatureViewEngine.get_hsml_model_value(hsml_model)
                 if hsml_model
-                else None
-                for _ in range(len(features))
-            ],
-            dtype=pd.StringDtype(),
+                else None,
+                index=features.index,
+                dtype=pd.StringDtype(),
+            ),
+            time_col_name: pd.Series(
+                np.datetime64(datetime.now(), "ns"), index=features.index
+            ),
+            "log_id": pd.Series(
+                Engine._generate_log_ids(len(features)), index=features.index
+            ),
+        }
+        if td_predictions and predictions is not None:
+            for col in predictions.columns:
+                log_columns.setdefault(col, predictions[col])
+
+        # select the logging feature group columns without copying their data
+        return pd.DataFrame(
+            {
+                feat.name: log_columns[feat.name]
+                if feat.name in log_columns
+                else features[feat.name]
+                for feat in fg.features
+            },
+            copy=False,
         )
-        now = datetime.now()
 
-        features[time_col_name] = pd.Series([now for _ in range(len(features))])
-        features["log_id"] = [str(uuid.uuid4()) for _ in range(len(features))]
-        return features[[feat.name for feat in fg.features]]
+    @staticmethod
+    def _generate_log_ids(n: int) -> np.ndarray:
+        # random version 4 uuids, formatted from a single os.urandom call instead of
+        # calling uuid.uuid4 for every row
+        raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+        hex_digits = np.frombuffer(raw.tobytes().hex().encode(), dtype="S1")
+        uuids = np.insert(hex_digits.reshape(n, 32), [8, 12, 16, 20], b"-", axis=1)
+        return uuids.view("S36").ravel().astype(str).astype(object)
 
     @staticmethod
     def read_feature_log(query):
@@ -298,9 +298,7 @@ class Engine:
             dataframe = dataframe.toDF()
 
         if isinstance(dataframe, DataFrame):
-            upper_case_features = [
-                c for c in dataframe.columns if any(re.finditer("[A-Z]", c))
-            ]
+            upper_case_features = [c for c in dataframe.columns if c != c.lower()]
             space_features = [c for c in dataframe.columns if " " in c]
             if len(upper_case_features) > 0:
                 warnings.warn(
@@ -1025,7 +1023,10 @@ class Engine:
             response = self._dataset_api.read_content(file, util.get_dataset_type(file))
 
             with open(tmp_file, "wb") as f:
-                f.write(response.content)
+                for chunk in response.iter_content(
+                    chunk_size=self._dataset_api.DEFAULT_FLOW_CHUNK_SIZE
+                ):
+                    f.write(chunk)
         else:
             self._spark_context.addFile(file)
 
@@ -34,7 +34,7 @@ class Feature:
     feature representation of training dataset schemas.
     """
 
-    COMPLEX_TYPES = ["MAP", "ARRAY", "STRUCT", "UNIONTYPE"]
+    COMPLEX_TYPES = ("MAP", "ARRAY", "STRUCT", "UNIONTYPE")
 
     def __init__(
         self,
@@ -125,7 +125,7 @@ class Feature:
             selected_feature.is_complex()
             ```
         """
-        return any(map(self._type.upper().startswith, self.COMPLEX_TYPES))
+        return self._type.upper().startswith(self.COMPLEX_TYPES)
 
     @property
     def name(self) -> str:
@@ -143,6 +143,7 @@ class FeatureGroupBase:
         self._location = location
         self._id = id
         self._subject = None
+        self._feature_avro_schemas: Optional[Dict[str, str]] = None
         self._online_topic_name = online_topic_name
         self._topic_name = topic_name
         self._notification_topic_name = notification_topic_name
@@ -2007,9 +2008,13 @@ class FeatureGroupBase:
         return schema_s
 
     def _get_feature_avro_schema(self, feature_name: str) -> str:
-        for field in json.loads(self.avro_schema)["fields"]:
-            if field["name"] == feature_name:
-                return json.dumps(field["type"])
+        if self._feature_avro_schemas is None:
+            # parse the feature group schema once instead of once per complex feature
+            self._feature_avro_schemas = {
+                field["name"]: json.dumps(field["type"])
+                for field in json.loads(self.avro_schema)["fields"]
+            }
+        return self._feature_avro_schemas.get(feature_name)
 
     @property
     def features(self) -> List["feature.Feature"]:
@@ -2578,6 +2583,8 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_batch_size` and an integer value to set how many rows of a pandas
+                  dataframe are converted to kafka records at a time, defaults to `20000`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -2767,6 +2774,8 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_batch_size` and an integer value to set how many rows of a pandas
+                  dataframe are converted to kafka records at a time, defaults to `20000`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -2931,6 +2940,8 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_batch_size` and an integer value to set how many rows of a pandas
+                  dataframe are converted to kafka records at a time, defaults to `20000`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -3828,6 +3839,8 @@ class ExternalFeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_batch_size` and an integer value to set how many rows of a pandas
+                  dataframe are converted to kafka records at a time, defaults to `20000`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -456,6 +456,9 @@ class FeatureStore:
                 this instructs the library to use the `host` parameter in the [`hsfs.connection()`](connection_api.md#connection) to establish the connection to the online feature store.
                 If not set, or set to False, the online feature store storage connector is used which relies on
                 the private ip.
+                When reading online feature store data as pandas dataframe, users can provide an entry
+                `{'dtype_backend': 'pyarrow'}` to return arrow backed columns instead of numpy/object columns,
+                this requires pandas 2.0.0 or higher.
                 Defaults to `{}`.
 
         # Returns
@@ -18,6 +18,7 @@ from __future__ import annotations
 import json
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from typing import (
     Any,
@@ -99,6 +100,8 @@ SplineDataFrameTypes = Union[
 @typechecked
 class FeatureView:
     ENTITY_TYPE = "featureview"
+    # maximum number of concurrent vector db lookups for batch feature vector retrieval
+    MAX_VECTOR_DB_PARALLEL_READS = 8
 
     def __init__(
         self,
@@ -704,9 +707,14 @@ class FeatureView:
             self.init_serving(external=external, init_rest_client=force_rest_client)
 
         vector_db_features = []
-        if self._vector_db_client:
-            for _entry in entry:
-                vector_db_features.append(self._get_vector_db_result(_entry))
+        if self._vector_db_client and len(entry) > 0:
+            # lookups of different entries are independent, issue them concurrently
+            with ThreadPoolExecutor(
+                min(len(entry), self.MAX_VECTOR_DB_PARALLEL_READS)
+            ) as executor:
+                vector_db_features = list(
+                    executor.map(self._get_vector_db_result, entry)
+                )
 
         return self._vector_server.get_feature_vectors(
             entries=entry,
@@ -2355,6 +2363,9 @@ class FeatureView:
                 following entries:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"max_concurrent_transformations"` to set how many splits the transformation
+                  functions are applied to in parallel, defaults to the number of splits capped by the
+                  number of CPUs.
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration](../job_configuration)
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -2558,6 +2569,9 @@ class FeatureView:
                 following entries:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"max_concurrent_transformations"` to set how many splits the transformation
+                  functions are applied to in parallel, defaults to the number of splits capped by the
+                  number of CPUs.
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration](../job_configuration)
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -2701,6 +2715,12 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"columns"` to only read a subset of the columns of the materialized training data.
+                  For example: `{"columns": ["amount", "label"]}`
+                * key `"max_concurrent_reads"` to set how many training data files are read in parallel,
+                  defaults to 8.
+                * key `"arrow_batch_size"` to decode parquet files downloaded from HopsFS or S3 in
+                  record batches of this many rows, by default files are decoded at once.
                 Defaults to `{}`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
@@ -2768,6 +2788,12 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"columns"` to only read a subset of the columns of the materialized training data.
+                  For example: `{"columns": ["amount", "label"]}`
+                * key `"max_concurrent_reads"` to set how many training data files are read in parallel,
+                  defaults to 8.
+                * key `"arrow_batch_size"` to decode parquet files downloaded from HopsFS or S3 in
+                  record batches of this many rows, by default files are decoded at once.
                 Defaults to `{}`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
@@ -2839,6 +2865,12 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"columns"` to only read a subset of the columns of the materialized training data.
+                  For example: `{"columns": ["amount", "label"]}`
+                * key `"max_concurrent_reads"` to set how many training data files are read in parallel,
+                  defaults to 8.
+                * key `"arrow_batch_size"` to decode parquet files downloaded from HopsFS or S3 in
+                  record batches of this many rows, by default files are decoded at once.
                 Defaults to `{}`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
@@ -3455,10 +3487,11 @@ class FeatureView:
         )
         features = json_decamelized.get("features", [])
         if features:
+            feature_groups = {}
             for feature_index in range(len(features)):
                 feature = (
                     training_dataset_feature.TrainingDatasetFeature.from_response_json(
-                        features[feature_index]
+                        features[feature_index], feature_groups=feature_groups
                     )
                 )
                 features[feature_index] = feature
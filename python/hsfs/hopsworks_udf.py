@@ -195,6 +195,9 @@ class HopsworksUdf:
 
         self._output_column_names: List[str] = []
 
+        # Python wrapper built by `get_udf`, reset whenever the statistics or output column names change.
+        self._python_udf: Optional[Callable] = None
+
     @staticmethod
     def _validate_and_convert_drop_features(
         dropped_features: Union[str, List[str]],
@@ -568,6 +571,7 @@ def renaming_wrapper(*args):
             )
         ]
         udf.dropped_features = updated_dropped_features
+        udf._python_udf = None
         return udf
 
     def update_return_type_one_hot(self):
@@ -591,7 +595,9 @@ def renaming_wrapper(*args):
         """
 
         if engine.get_type() in ["python", "training"] or force_python_udf:
-            return self.hopsworksUdf_wrapper()
+            if self._python_udf is None:
+                self._python_udf = self.hopsworksUdf_wrapper()
+            return self._python_udf
         else:
             from pyspark.sql.functions import pandas_udf
 
@@ -833,6 +839,7 @@ def renaming_wrapper(*args):
     def transformation_statistics(
         self, statistics: List[FeatureDescriptiveStatistics]
     ) -> None:
+        self._python_udf = None
         self._statistics = TransformationStatistics(*self._statistics_argument_names)
         for stat in statistics:
             if stat.feature_name in self._statistics_argument_mapping.keys():
@@ -849,6 +856,7 @@ def renaming_wrapper(*args):
                 f"Provided names for output columns does not match the number of columns returned from the UDF. Please provide {len(self.return_types)} names."
             )
         else:
+            self._python_udf = None
             self._output_column_names = output_col_names
 
     def __repr__(self):
@@ -142,8 +142,11 @@ class TrainingDatasetBase:
 
             if features is None:
                 features = []
+            feature_groups = {}
             self._features = [
-                training_dataset_feature.TrainingDatasetFeature.from_response_json(feat)
+                training_dataset_feature.TrainingDatasetFeature.from_response_json(
+                    feat, feature_groups=feature_groups
+                )
                 for feat in features
             ]
             self._splits = [
@@ -15,7 +15,8 @@
 #
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 import humps
 from hsfs import feature as feature_mod
@@ -25,6 +26,19 @@ from hsfs.transformation_function import TransformationFunction, TransformationT
 
 
 class TrainingDatasetFeature:
+    # feature views and training datasets hold one instance per feature
+    __slots__ = (
+        "_name",
+        "_type",
+        "_index",
+        "_feature_group",
+        "_feature_group_feature_name",
+        "_label",
+        "_inference_helper_column",
+        "_training_helper_column",
+        "_on_demand_transformation_function",
+    )
+
     def __init__(
         self,
         name,
@@ -69,9 +83,28 @@ class TrainingDatasetFeature:
         }
 
     @classmethod
-    def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+    def from_response_json(cls, json_dict, feature_groups=None):
+        # only the top level keys are decamelized here, the nested feature group is
+        # decamelized by FeatureGroup.from_response_json
+        keys = _decamelize_keys(tuple(json_dict))
+        json_decamelized = {keys[key]: value for key, value in json_dict.items()}
+        featuregroup = json_decamelized.get("featuregroup")
+        if (
+            feature_groups is not None
+            and isinstance(featuregroup, dict)
+            and featuregroup.get("id") is not None
+        ):
+            # features of the same response share the feature group object, so that
+            # it is parsed once per feature group instead of once per feature
+            if featuregroup["id"] not in feature_groups:
+                feature_groups[featuregroup["id"]] = (
+                    feature_group_mod.FeatureGroup.from_response_json(featuregroup)
+                )
+            json_decamelized["featuregroup"] = feature_groups[featuregroup["id"]]
         if json_decamelized.get("transformation_function", False):
+            json_decamelized["transformation_function"] = humps.decamelize(
+                json_decamelized["transformation_function"]
+            )
             json_decamelized["transformation_function"]["transformation_type"] = (
                 TransformationType.ON_DEMAND
             )
@@ -84,9 +117,7 @@ class TrainingDatasetFeature:
 
     def is_complex(self):
         """Returns true if the feature has a complex type."""
-        return any(
-            map(str(self._type).upper().startswith, feature_mod.Feature.COMPLEX_TYPES)
-        )
+        return str(self._type).upper().startswith(feature_mod.Feature.COMPLEX_TYPES)
 
     @property
     def name(self):
@@ -152,3 +183,9 @@ class TrainingDatasetFeature:
 
     def __repr__(self):
         return f"Training Dataset Feature({self._name!r}, {self._type!r}, {self._index!r}, {self._label}, {self._feature_group_feature_name}, {self._feature_group.id!r}, {self.on_demand_transformation_function})"
+
+
+@lru_cache(maxsize=256)
+def _decamelize_keys(keys: Tuple[str, ...]) -> Dict[str, str]:
+    # the features of a training dataset share the same few key sets
+    return {key: humps.decamelize(key) for key in keys}
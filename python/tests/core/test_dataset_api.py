@@ -0,0 +1,44 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import io
+
+import pandas as pd
+import polars as pl
+from hsfs.core import dataset_api
+
+
+class TestDatasetApi:
+    def test_upload_feature_group_polars(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("hopsworks_common.util.feature_group_name", return_value="fg_1")
+        ds_api = dataset_api.DatasetApi()
+        ds_api.DEFAULT_FLOW_CHUNK_SIZE = 64
+        mock_upload_request = mocker.patch.object(ds_api, "_upload_request")
+        df = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+        # Act
+        ds_api.upload_feature_group(mocker.Mock(), "/path", df)
+
+        # Assert
+        chunks = [call.args[3] for call in mock_upload_request.call_args_list]
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 64 for chunk in chunks)
+        uploaded = pd.read_parquet(io.BytesIO(b"".join(chunks)))
+        assert uploaded.to_dict(orient="list") == {
+            "col1": [1, 2, 3],
+            "col2": ["a", "b", "c"],
+        }
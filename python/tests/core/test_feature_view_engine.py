@@ -960,6 +960,55 @@ class TestFeatureViewEngine:
         assert mock_fv_engine_read_from_storage_connector.call_count == 0
         assert mock_fv_engine_compute_training_dataset_statistics.call_count == 0
 
+    def test_get_training_data_event_time_range_time_series_splits(self):
+        # Arrange
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+            train_start=1704067200000,
+            train_end=1704153600000,
+            validation_start=1704240000000,
+            validation_end=1704326400000,
+            test_start=1704326400000,
+            test_end=1704412800000,
+            time_split_size=3,
+        )
+
+        # Act
+        result = (
+            feature_view_engine.FeatureViewEngine._get_training_data_event_time_range(
+                td
+            )
+        )
+
+        # Assert
+        assert result == (1704067200000, 1704412800000)
+
+    def test_get_training_data_event_time_range_random_splits(self):
+        # Arrange
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+            test_size=0.2,
+            event_start_time=1704067200000,
+        )
+
+        # Act
+        result = (
+            feature_view_engine.FeatureViewEngine._get_training_data_event_time_range(
+                td
+            )
+        )
+
+        # Assert
+        assert result == (1704067200000, None)
+
     def test_recreate_training_dataset(self, mocker):
         # Arrange
         feature_store_id = 99
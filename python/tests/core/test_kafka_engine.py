@@ -82,6 +82,20 @@ class TestKafkaEngine:
         assert len(result) == 2
         assert result == {"one": b"1", "two": b"2"}
 
+    def test_encode_complex_features_shorter_value_after_longer(self):
+        # Arrange
+        def test_utf(value, bytes_io):
+            bytes_io.write(bytes(value, "utf-8"))
+
+        # Act
+        result = kafka_engine.encode_complex_features(
+            feature_writers={"one": test_utf, "two": test_utf},
+            row={"one": "long value", "two": "2", "three": "3"},
+        )
+
+        # Assert
+        assert result == {"one": b"long value", "two": b"2", "three": "3"}
+
     def test_get_encoder_func(self, mocker):
         # Arrange
         mock_json_loads = mocker.patch("json.loads")
@@ -137,6 +151,28 @@ class TestKafkaEngine:
         assert mock_json_loads.call_count == 1
         assert mock_avro_schema_parse.call_count == 0
 
+    def test_get_encoder_func_cached(self, mocker):
+        # Arrange
+        constants.HAS_AVRO = False
+        constants.HAS_FAST_AVRO = True
+        importlib.reload(kafka_engine)
+        mock_parse_schema = mocker.patch(
+            "hsfs.core.kafka_engine.parse_schema", return_value={}
+        )
+        writer_schema = (
+            '{"type" : "record", "name" : "Employee",'
+            '"fields" : [{ "name" : "Name" , "type" : "string" }]}'
+        )
+
+        # Act
+        first_result = kafka_engine.get_encoder_func(writer_schema)
+        second_result = kafka_engine.get_encoder_func(writer_schema)
+        kafka_engine.get_encoder_func('{"type": "string"}')
+
+        # Assert
+        assert first_result is second_result
+        assert mock_parse_schema.call_count == 2
+
     def test_get_kafka_config(self, mocker, backend_fixtures):
         # Arrange
         mocker.patch("hsfs.engine.get_instance")
@@ -0,0 +1,240 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+
+from hsfs import serving_key
+from hsfs.constructor import prepared_statement_parameter, serving_prepared_statement
+from hsfs.core import online_store_sql_engine
+
+
+class TestOnlineStoreSqlClient:
+    def _client(self, mocker):
+        mocker.patch("hopsworks_common.client.get_instance")
+        return online_store_sql_engine.OnlineStoreSqlClient(
+            feature_store_id=99, skip_fg_ids=None, external=False
+        )
+
+    def test_execute_prep_statements_single_statement(self, mocker):
+        # Arrange
+        client = self._client(mocker)
+        mock_query = mocker.patch.object(
+            client, "_query_async_sql", mocker.AsyncMock(return_value=[{"a": 1}])
+        )
+        mock_create_task = mocker.patch("asyncio.create_task")
+
+        # Act
+        result = asyncio.run(
+            client._execute_prep_statements({0: "stmt_0"}, {0: {"pk": 1}})
+        )
+
+        # Assert
+        assert result == {0: [{"a": 1}]}
+        mock_query.assert_awaited_once_with("stmt_0", {"pk": 1})
+        mock_create_task.assert_not_called()
+
+    def test_execute_prep_statements_multiple_statements(self, mocker):
+        # Arrange
+        client = self._client(mocker)
+
+        async def query(stmt, bind_params):
+            return [{stmt: bind_params["pk"]}]
+
+        mocker.patch.object(client, "_query_async_sql", side_effect=query)
+
+        # Act
+        result = asyncio.run(
+            client._execute_prep_statements(
+                {0: "stmt_0", 1: "stmt_1", 2: "stmt_2"},
+                {0: {"pk": 1}, 2: {"pk": 3}},
+            )
+        )
+
+        # Assert
+        assert result == {0: [{"stmt_0": 1}], 2: [{"stmt_2": 3}]}
+
+    def test_batch_vector_results(self, mocker):
+        # Arrange
+        client = self._client(mocker)
+        client._serving_key_by_serving_index = {
+            0: [serving_key.ServingKey(feature_name="id", join_index=0)],
+            1: [
+                serving_key.ServingKey(feature_name="id", join_index=1, prefix="right_")
+            ],
+        }
+        client.prefix_by_serving_index = {0: None, 1: "right_"}
+        mocker.patch.object(
+            client,
+            "_execute_prep_statements",
+            mocker.AsyncMock(
+                return_value={
+                    0: [{"id": 2, "a": "a2"}, {"id": 1, "a": "a1"}],
+                    1: [{"right_id": 1, "b": "b1"}],
+                }
+            ),
+        )
+
+        # Act
+        batch_results, serving_keys = client._batch_vector_results(
+            [{"id": 1, "right_id": 1}, {"id": 2, "right_id": 2}],
+            {0: "stmt_0", 1: "stmt_1"},
+        )
+
+        # Assert
+        assert batch_results == [
+            {"id": 1, "a": "a1", "right_id": 1, "b": "b1"},
+            {"id": 2, "a": "a2"},
+        ]
+        assert [sk.feature_name for sk in serving_keys] == ["id", "id"]
+
+    def test_parametrize_query(self):
+        # Arrange
+        query = "SELECT `a` FROM `fg_1` WHERE `pk1` = ? AND `pk2` = ?"
+
+        # Act
+        query = online_store_sql_engine.OnlineStoreSqlClient._parametrize_query(
+            "pk1", query
+        )
+        query = online_store_sql_engine.OnlineStoreSqlClient._parametrize_query(
+            "pk2", query
+        )
+
+        # Assert
+        assert query == "SELECT `a` FROM `fg_1` WHERE `pk1` = :pk1 AND `pk2` = :pk2"
+
+    def test_fetch_prepared_statements_reuses_existing(self, mocker):
+        # Arrange
+        client = self._client(mocker)
+        mock_get_serving_prepared_statement = mocker.patch(
+            "hsfs.core.feature_view_api.FeatureViewApi.get_serving_prepared_statement",
+            return_value=["fetched"],
+        )
+        entity = mocker.Mock()
+        client.prepared_statements = {
+            client.SINGLE_VECTOR_KEY: ["cached_single"],
+            client.BATCH_VECTOR_KEY: ["cached_batch"],
+        }
+
+        # Act
+        client.fetch_prepared_statements(entity, inference_helper_columns=True)
+
+        # Assert
+        assert mock_get_serving_prepared_statement.call_count == 2
+        assert client.prepared_statements == {
+            client.SINGLE_VECTOR_KEY: ["cached_single"],
+            client.BATCH_VECTOR_KEY: ["cached_batch"],
+            client.SINGLE_HELPER_KEY: ["fetched"],
+            client.BATCH_HELPER_KEY: ["fetched"],
+        }
+
+    def test_query_async_sql_applies_result_value_handlers(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        client = online_store_sql_engine.OnlineStoreSqlClient(
+            feature_store_id=99,
+            skip_fg_ids=None,
+            external=False,
+            result_value_handlers={"b": lambda value: value * 2},
+        )
+        cursor = mocker.AsyncMock()
+        cursor.fetchall.return_value = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+        conn = mocker.AsyncMock()
+        conn.execute.return_value = cursor
+        client._connection_pool = mocker.MagicMock()
+        client._connection_pool.acquire.return_value.__aenter__.return_value = conn
+
+        # Act
+        result = asyncio.run(client._query_async_sql("stmt", {"pk": 1}))
+
+        # Assert
+        assert result == [{"a": 1, "b": 4}, {"a": 3, "b": 8}]
+
+    def test_init_parametrize_and_serving_utils(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        pk1 = serving_key.ServingKey(feature_name="pk1", join_index=0)
+        pk2 = serving_key.ServingKey(feature_name="pk2", join_index=0)
+        right_pk = serving_key.ServingKey(
+            feature_name="pk1", join_index=1, prefix="right_"
+        )
+        client = online_store_sql_engine.OnlineStoreSqlClient(
+            feature_store_id=99,
+            skip_fg_ids=None,
+            external=False,
+            serving_keys=[pk2, right_pk, pk1],
+        )
+        prepared_statements = [
+            serving_prepared_statement.ServingPreparedStatement(
+                prepared_statement_index=0,
+                prepared_statement_parameters=[
+                    prepared_statement_parameter.PreparedStatementParameter(
+                        name="pk2", index=1
+                    ),
+                    prepared_statement_parameter.PreparedStatementParameter(
+                        name="pk1", index=0
+                    ),
+                ],
+            ),
+            serving_prepared_statement.ServingPreparedStatement(
+                prepared_statement_index=1,
+                prepared_statement_parameters=[
+                    prepared_statement_parameter.PreparedStatementParameter(
+                        name="pk1", index=0
+                    ),
+                ],
+                prefix="right_",
+            ),
+        ]
+
+        # Act
+        client.init_parametrize_and_serving_utils(prepared_statements)
+
+        # Assert
+        assert client.serving_key_by_serving_index == {0: [pk1, pk2], 1: [right_pk]}
+        assert client.feature_name_order_by_psp == {
+            0: {"pk1": 0, "pk2": 1},
+            1: {"pk1": 0},
+        }
+        assert client.prefix_by_serving_index == {0: None, 1: "right_"}
+
+    def test_batch_vector_results_deduplicates_entries(self, mocker):
+        # Arrange
+        client = self._client(mocker)
+        client._serving_key_by_serving_index = {
+            0: [serving_key.ServingKey(feature_name="id", join_index=0)],
+        }
+        client.prefix_by_serving_index = {0: None}
+        mock_execute_prep_statements = mocker.patch.object(
+            client,
+            "_execute_prep_statements",
+            mocker.AsyncMock(
+                return_value={0: [{"id": 1, "a": "a1"}, {"id": 2, "a": "a2"}]}
+            ),
+        )
+
+        # Act
+        batch_results, _ = client._batch_vector_results(
+            [{"id": 1}, {"id": 2}, {"id": 1}], {0: "stmt_0"}
+        )
+
+        # Assert
+        mock_execute_prep_statements.assert_awaited_once_with(
+            {0: "stmt_0"}, {0: {"batch_ids": [(1,), (2,)]}}
+        )
+        assert batch_results == [
+            {"id": 1, "a": "a1"},
+            {"id": 2, "a": "a2"},
+            {"id": 1, "a": "a1"},
+        ]
@@ -262,7 +262,10 @@ class TestTrainingDatasetEngine:
 
         # Act
         result = td_engine.query(
-            training_dataset=None, online=None, with_label=None, is_hive_query=None
+            training_dataset=mocker.Mock(),
+            online=None,
+            with_label=None,
+            is_hive_query=None,
         )
 
         # Assert
@@ -287,7 +290,10 @@ class TestTrainingDatasetEngine:
 
         # Act
         result = td_engine.query(
-            training_dataset=None, online=None, with_label=None, is_hive_query=None
+            training_dataset=mocker.Mock(),
+            online=None,
+            with_label=None,
+            is_hive_query=None,
         )
 
         # Assert
@@ -312,7 +318,10 @@ class TestTrainingDatasetEngine:
 
         # Act
         result = td_engine.query(
-            training_dataset=None, online=True, with_label=None, is_hive_query=None
+            training_dataset=mocker.Mock(),
+            online=True,
+            with_label=None,
+            is_hive_query=None,
         )
 
         # Assert
@@ -327,6 +336,42 @@ class TestTrainingDatasetEngine:
         )
         assert result == mock_td_api.return_value.get_query.return_value.query_online
 
+    def test_query_cached(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mock_td_api = mocker.patch("hsfs.core.training_dataset_api.TrainingDatasetApi")
+
+        td_engine = training_dataset_engine.TrainingDatasetEngine(feature_store_id)
+
+        td = mocker.Mock()
+        td.id = 11
+
+        # Act
+        online_result = td_engine.query(
+            training_dataset=td, online=True, with_label=True, is_hive_query=False
+        )
+        offline_result = td_engine.query(
+            training_dataset=td, online=False, with_label=True, is_hive_query=False
+        )
+        td_engine.query(
+            training_dataset=td, online=True, with_label=False, is_hive_query=False
+        )
+
+        # Assert
+        assert mock_td_api.return_value.get_query.call_count == 2
+        assert (
+            online_result
+            == mock_td_api.return_value.get_query.return_value.query_online
+        )
+        assert (
+            offline_result == mock_td_api.return_value.get_query.return_value.pit_query
+        )
+        assert (
+            mock_td_api.return_value.get_query.return_value.register_external.call_count
+            == 1
+        )
+
     def test_add_tag(self, mocker):
         # Arrange
         feature_store_id = 99
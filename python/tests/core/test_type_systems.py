@@ -747,3 +747,79 @@ class TestTypeSystems:
 
         # Assert
         assert str(e_info.value) == "Not supported type wrong."
+
+    @pytest.mark.skipif(not HAS_PANDAS, reason="Pandas is not installed")
+    def test_cast_pandas_column_to_offline_type_matching_dtype(self):
+        # Arrange
+        columns = {
+            "bigint": pd.Series([1, None], dtype=pd.Int64Dtype()),
+            "double": pd.Series([1.0, 2.0]),
+            "timestamp": pd.Series(pd.to_datetime(["2024-01-01", "2024-01-02"])),
+            "boolean": pd.Series([True, False]),
+        }
+
+        # Act
+        result = {
+            offline_type: type_systems.cast_pandas_column_to_offline_type(
+                column, offline_type
+            )
+            for offline_type, column in columns.items()
+        }
+
+        # Assert
+        for offline_type, column in columns.items():
+            assert result[offline_type] is column
+
+    @pytest.mark.skipif(not HAS_PANDAS, reason="Pandas is not installed")
+    def test_cast_pandas_column_to_offline_type_float_to_string(self):
+        # Arrange
+        column = pd.Series([1.5, 2.0])
+
+        # Act
+        result = type_systems.cast_pandas_column_to_offline_type(column, "string")
+
+        # Assert
+        assert result.tolist() == ["1.5", "2.0"]
+
+    @pytest.mark.skipif(not HAS_PANDAS, reason="Pandas is not installed")
+    def test_cast_pandas_columns_to_offline_type(self):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "bigint": [1, 2],
+                "float": [1.0, 2.0],
+                "double": [1.0, 2.0],
+                "string": [1, 2],
+                "other": ["a", "b"],
+            }
+        )
+
+        # Act
+        result = type_systems.cast_pandas_columns_to_offline_type(
+            df,
+            {
+                "bigint": "BIGINT",
+                "float": "float",
+                "double": "double",
+                "string": "string",
+            },
+        )
+
+        # Assert
+        assert result["bigint"].dtype == pd.Int64Dtype()
+        assert result["float"].dtype == np.dtype("float32")
+        assert result["double"].dtype == np.dtype("float64")
+        assert result["string"].tolist() == ["1", "2"]
+        assert result["other"].tolist() == ["a", "b"]
+
+    @pytest.mark.skipif(not HAS_PANDAS, reason="Pandas is not installed")
+    def test_cast_column_to_online_type_different_dtype(self):
+        # Arrange
+        column = pd.Series([1, 2])
+
+        # Act
+        result = type_systems.cast_column_to_online_type(column, "int")
+
+        # Assert
+        assert result is not column
+        assert result.dtype == pd.Int32Dtype()
@@ -0,0 +1,253 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import json
+from base64 import b64encode
+from io import BytesIO
+
+import numpy as np
+from fastavro import parse_schema, schemaless_writer
+from hsfs.core import vector_server
+from hsfs.hopsworks_udf import udf
+from hsfs.transformation_function import TransformationFunction, TransformationType
+
+
+RECORD_SCHEMA = json.dumps(
+    [
+        "null",
+        {
+            "type": "record",
+            "name": "r",
+            "fields": [{"name": "a", "type": "int"}, {"name": "b", "type": "string"}],
+        },
+    ]
+)
+
+
+def _encode(value):
+    buffer = BytesIO()
+    schemaless_writer(buffer, parse_schema(json.loads(RECORD_SCHEMA)), value)
+    return buffer.getvalue()
+
+
+class TestVectorServer:
+    def test_build_complex_feature_decoder_bytes(self):
+        # Arrange
+        decoder = vector_server.VectorServer._build_complex_feature_decoder(
+            RECORD_SCHEMA
+        )
+
+        # Act
+        result = decoder(_encode({"a": 1, "b": "x"}))
+
+        # Assert
+        assert result == {"a": 1, "b": "x"}
+
+    def test_build_complex_feature_decoder_base64_string(self):
+        # Arrange
+        decoder = vector_server.VectorServer._build_complex_feature_decoder(
+            RECORD_SCHEMA
+        )
+
+        # Act
+        result = decoder(b64encode(_encode({"a": 2, "b": "y"})).decode())
+
+        # Assert
+        assert result == {"a": 2, "b": "y"}
+
+    def test_build_complex_feature_decoder_already_deserialized(self):
+        # Arrange
+        decoder = vector_server.VectorServer._build_complex_feature_decoder(
+            RECORD_SCHEMA
+        )
+
+        # Act
+        result = decoder({"a": 3, "b": "z"})
+
+        # Assert
+        assert result == {"a": 3, "b": "z"}
+
+    def test_build_complex_feature_decoder_avro_fallback(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.vector_server.HAS_FASTAVRO", False)
+        mocker.patch(
+            "hsfs.core.vector_server.BinaryDecoder",
+            vector_server.avro.io.BinaryDecoder,
+            create=True,
+        )
+        decoder = vector_server.VectorServer._build_complex_feature_decoder(
+            RECORD_SCHEMA
+        )
+
+        # Act
+        result = decoder(_encode({"a": 4, "b": "w"}))
+
+        # Assert
+        assert result == {"a": 4, "b": "w"}
+
+    def test_get_feature_vectors_keeps_order_with_skipped_entries(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        vs = vector_server.VectorServer(feature_store_id=99)
+        mocker.patch.object(
+            vs, "which_client_and_ensure_initialised", return_value="sql"
+        )
+        mocker.patch.object(
+            vs,
+            "validate_entry",
+            side_effect=lambda entry, **kwargs: entry,
+        )
+        vs._sql_client = mocker.Mock()
+        vs._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": 1}, {"id": 3}],
+            [],
+        )
+        vs._feature_vector_col_name = ["id"]
+        mock_assemble = mocker.patch.object(
+            vs,
+            "assemble_feature_dict",
+            side_effect=lambda result_dict, **kwargs: result_dict,
+        )
+
+        # Act
+        result = vs.get_feature_vectors(
+            entries=[{"id": 1}, {}, {"id": 3}, {}],
+            return_type="list",
+            vector_db_features=[],
+        )
+
+        # Assert
+        vs._sql_client.get_batch_feature_vectors.assert_called_once_with(
+            [{"id": 1}, {"id": 3}]
+        )
+        assert mock_assemble.call_count == 4
+        assert result == [[1], [None], [3], [None]]
+
+    def test_apply_batch_transformation_matches_per_row(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(int)
+        def add_one(a):
+            return a + 1
+
+        @udf(int)
+        def plus(a, b):
+            return a + b
+
+        vs = vector_server.VectorServer(feature_store_id=99)
+        vs._model_dependent_transformation_functions = [
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=add_one("a"),
+                transformation_type=TransformationType.MODEL_DEPENDENT,
+            )
+        ]
+        vs._on_demand_transformation_functions = [
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=plus("a", "b"),
+                transformation_type=TransformationType.ON_DEMAND,
+            )
+        ]
+        request_parameters = [{"b": 100}, {}]
+
+        # Act
+        batch_result = vs.apply_batch_transformation(
+            [{"a": 1, "b": 10}, {"a": 2, "b": 20}], request_parameters
+        )
+        row_result = [
+            vs.apply_transformation(row, request_parameter)
+            for row, request_parameter in zip(
+                [{"a": 1, "b": 10}, {"a": 2, "b": 20}], request_parameters
+            )
+        ]
+
+        # Assert
+        assert batch_result == row_result
+        assert batch_result == [
+            {"a": 1, "b": 10, "plus": 101, "add_one_a_": 2},
+            {"a": 2, "b": 20, "plus": 22, "add_one_a_": 3},
+        ]
+
+    def test_apply_batch_transformation_missing_value_keeps_types(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(int)
+        def add_one(a):
+            return a.fillna(0) + 1
+
+        vs = vector_server.VectorServer(feature_store_id=99)
+        vs._model_dependent_transformation_functions = [
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=add_one("a"),
+                transformation_type=TransformationType.MODEL_DEPENDENT,
+            )
+        ]
+        vs._on_demand_transformation_functions = []
+
+        # Act
+        batch_result = vs.apply_batch_transformation(
+            [{"a": 1}, {"a": np.nan}, {"a": 3}], [{}, {}, {}]
+        )
+        row_result = [
+            vs.apply_transformation(row, {})
+            for row in [{"a": 1}, {"a": np.nan}, {"a": 3}]
+        ]
+
+        # Assert
+        assert batch_result == row_result
+        assert [row["add_one_a_"] for row in batch_result] == [2, 1, 4]
+        assert isinstance(batch_result[0]["add_one_a_"], (int, np.integer))
+        assert isinstance(batch_result[2]["add_one_a_"], (int, np.integer))
+
+    def test_apply_return_value_handlers_without_features_to_handle(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        vs = vector_server.VectorServer(feature_store_id=99)
+        vs._feature_to_handle_if_sql = set()
+        vs._feature_to_handle_if_rest = {"ts"}
+        handler = mocker.Mock(return_value="handled")
+        vs._return_feature_value_handlers = {"ts": handler}
+
+        # Act
+        sql_result = vs.apply_return_value_handlers({"ts": "value"}, client="sql")
+        rest_result = vs.apply_return_value_handlers({"ts": "value"}, client="rest")
+
+        # Assert
+        assert sql_result == {"ts": "value"}
+        assert rest_result == {"ts": "handled"}
+        handler.assert_called_once_with("value")
+
+    def test_handle_feature_vector_return_type_pandas_single_vector(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        vs = vector_server.VectorServer(feature_store_id=99)
+        vs._untransformed_feature_vector_col_name = ["id", "amount", "name"]
+
+        # Act
+        result = vs.handle_feature_vector_return_type(
+            [1, 2.5, "a"], batch=False, inference_helper=False, return_type="pandas"
+        )
+
+        # Assert
+        assert list(result.columns) == ["id", "amount", "name"]
+        assert result.values.tolist() == [[1, 2.5, "a"]]
+        assert result["id"].dtype == "int64"
+        assert result["amount"].dtype == "float64"
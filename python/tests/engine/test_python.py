@@ -14,7 +14,12 @@
 #   limitations under the License.
 #
 import decimal
-from datetime import date, datetime
+import json
+import random
+import threading
+import uuid
+from datetime import date, datetime, timezone
+from io import BytesIO
 
 import hopsworks_common
 import numpy as np
@@ -22,6 +27,7 @@ import pandas as pd
 import polars as pl
 import pyarrow as pa
 import pytest
+from botocore.response import StreamingBody
 from hsfs import (
     engine,
     feature,
@@ -40,6 +46,7 @@ from hsfs.engine import python
 from hsfs.expectation_suite import ExpectationSuite
 from hsfs.hopsworks_udf import udf
 from hsfs.training_dataset_feature import TrainingDatasetFeature
+from hsfs.transformation_function import TransformationFunction, TransformationType
 from polars.testing import assert_frame_equal as polars_assert_frame_equal
 
 
@@ -159,6 +166,82 @@ class TestPython:
         assert mock_util_create_mysql_engine.call_count == 1
         assert mock_python_engine_return_dataframe_type.call_count == 1
 
+    def test_jdbc_pool_size_env(self, mocker, monkeypatch):
+        # Arrange
+        mock_util_create_mysql_engine = mocker.patch(
+            "hsfs.core.util_sql.create_mysql_engine"
+        )
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("hsfs.engine.python.Engine._return_dataframe_type")
+        monkeypatch.setenv("HSFS_ONLINE_POOL_SIZE", "16")
+        query = "SELECT * FROM TABLE"
+
+        python_engine = python.Engine()
+
+        # Act
+        python_engine._jdbc(
+            sql_query=query,
+            connector=None,
+            dataframe_type="default",
+            read_options={"external": False},
+        )
+        python_engine._jdbc(
+            sql_query=query,
+            connector=None,
+            dataframe_type="default",
+            read_options={"external": False},
+        )
+
+        # Assert
+        mock_util_create_mysql_engine.assert_called_once_with(
+            None, False, options={"pool_size": 16}
+        )
+
+    def test_jdbc_dtype_backend(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.util_sql.create_mysql_engine")
+        mocker.patch("hopsworks_common.client.get_instance")
+        mock_pandas_read_sql = mocker.patch("pandas.read_sql")
+        mocker.patch("hsfs.engine.python.Engine._return_dataframe_type")
+        query = "SELECT * FROM TABLE"
+
+        python_engine = python.Engine()
+
+        # Act
+        python_engine._jdbc(
+            sql_query=query,
+            connector=None,
+            dataframe_type="pandas",
+            read_options={"external": False, "dtype_backend": "pyarrow"},
+        )
+
+        # Assert
+        assert mock_pandas_read_sql.call_count == 1
+        assert mock_pandas_read_sql.call_args[1] == {"dtype_backend": "pyarrow"}
+
+    def test_jdbc_dtype_backend_pandas1(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.util_sql.create_mysql_engine")
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("pandas.__version__", "1.5.3")
+        mock_pandas_read_sql = mocker.patch("pandas.read_sql")
+        query = "SELECT * FROM TABLE"
+
+        python_engine = python.Engine()
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            python_engine._jdbc(
+                sql_query=query,
+                connector=None,
+                dataframe_type="pandas",
+                read_options={"external": False, "dtype_backend": "pyarrow"},
+            )
+
+        # Assert
+        assert "requires pandas 2.0.0 or higher" in str(e_info.value)
+        assert mock_pandas_read_sql.call_count == 0
+
     def test_read_none_data_format(self, mocker):
         # Arrange
         mocker.patch("pandas.concat")
@@ -340,6 +423,33 @@ class TestPython:
         assert mock_python_engine_read_hopsfs.call_count == 0
         assert mock_python_engine_read_s3.call_count == 0
 
+    def test_concat_to_pandas_arrow_tables(self):
+        # Arrange
+        tables = [
+            pa.Table.from_pandas(pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})),
+            pa.Table.from_pandas(pd.DataFrame({"col1": [3], "col2": ["c"]})),
+        ]
+
+        # Act
+        result = python.Engine._concat_to_pandas(tables)
+
+        # Assert
+        assert result.equals(pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}))
+
+    def test_concat_to_pandas_different_schemas(self):
+        # Arrange
+        df_list = [
+            pa.Table.from_pandas(pd.DataFrame({"col1": [1, 2]})),
+            pa.Table.from_pandas(pd.DataFrame({"col1": [3.5]}, index=[5])),
+            pd.DataFrame({"col1": [4]}),
+        ]
+
+        # Act
+        result = python.Engine._concat_to_pandas(df_list)
+
+        # Assert
+        assert result.equals(pd.DataFrame({"col1": [1.0, 2.0, 3.5, 4.0]}))
+
     def test_read_pandas_csv(self, mocker):
         # Arrange
         mock_pandas_read_csv = mocker.patch("pandas.read_csv")
@@ -385,6 +495,68 @@ class TestPython:
         assert mock_pandas_read_csv.call_count == 0
         assert mock_pandas_read_parquet.call_count == 1
 
+    def test_read_pandas_parquet_columns(self, mocker):
+        # Arrange
+        mock_pandas_read_parquet = mocker.patch("pandas.read_parquet")
+
+        python_engine = python.Engine()
+
+        # Act
+        python_engine._read_pandas(data_format="parquet", obj=None, columns=["col1"])
+
+        # Assert
+        mock_pandas_read_parquet.assert_called_once_with(None, columns=["col1"])
+
+    def test_read_pandas_parquet_streaming_body(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+        parquet_bytes = df.to_parquet()
+        body = StreamingBody(BytesIO(parquet_bytes), len(parquet_bytes))
+
+        # Act
+        result = python_engine._read_pandas(
+            data_format="parquet", obj=body, columns=["col2"]
+        )
+
+        # Assert
+        assert result.equals(df[["col2"]])
+
+    def test_read_pandas_parquet_batch_size(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+        # Act
+        result = python_engine._read_pandas(
+            data_format="parquet",
+            obj=BytesIO(df.to_parquet()),
+            columns=["col2"],
+            batch_size=2,
+        )
+
+        # Assert
+        assert result.equals(df[["col2"]])
+
+    def test_read_polars_parquet_batch_size(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+        buffer = BytesIO()
+        df.write_parquet(buffer)
+        buffer.seek(0)
+
+        # Act
+        result = python_engine._read_polars(
+            data_format="parquet", obj=buffer, batch_size=2
+        )
+
+        # Assert
+        polars_assert_frame_equal(result, df)
+
     def test_read_pandas_other(self, mocker):
         # Arrange
         mock_pandas_read_csv = mocker.patch("pandas.read_csv")
@@ -503,6 +675,77 @@ class TestPython:
         assert mock_dataset_api.return_value.list_files.call_count == 1
         assert mock_python_engine_read_pandas.call_count == 3
 
+    def test_is_metadata_file(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        # Act
+        result = [
+            python_engine._is_metadata_file(path)
+            for path in [
+                "/Projects/test/td/_SUCCESS",
+                "s3://bucket/td/_metadata.parquet",
+                "td/_temporary/",
+                "/Projects/test/td/part-0000.parquet",
+                "/Projects/test/_td/part_0000.parquet",
+            ]
+        ]
+
+        # Assert
+        assert result == [True, True, True, False, False]
+
+    def test_read_hopsfs_remote_keeps_file_order(self, mocker):
+        # Arrange
+        mock_dataset_api = mocker.patch("hsfs.core.dataset_api.DatasetApi")
+        mocker.patch(
+            "hsfs.engine.python.Engine._read_hopsfs_remote_file",
+            side_effect=lambda path, *args: path,
+        )
+
+        python_engine = python.Engine()
+
+        mock_dataset_api.return_value.list_files.return_value = (
+            4,
+            [
+                inode.Inode(attributes={"path": "test_path/part-0"}),
+                inode.Inode(attributes={"path": "test_path/_SUCCESS"}),
+                inode.Inode(attributes={"path": "test_path/part-1"}),
+                inode.Inode(attributes={"path": "test_path/part-2"}),
+            ],
+        )
+
+        # Act
+        result = python_engine._read_hopsfs_remote(
+            location=None, data_format=None, read_options={"max_concurrent_reads": 2}
+        )
+
+        # Assert
+        assert mock_dataset_api.return_value.list_files.call_count == 1
+        assert result == ["test_path/part-0", "test_path/part-1", "test_path/part-2"]
+
+    def test_read_hopsfs_remote_arrow_flight(self, mocker):
+        # Arrange
+        mock_dataset_api = mocker.patch("hsfs.core.dataset_api.DatasetApi")
+        mocker.patch(
+            "hsfs.core.arrow_flight_client.is_data_format_supported",
+            return_value=True,
+        )
+        mock_get_instance = mocker.patch("hsfs.core.arrow_flight_client.get_instance")
+
+        python_engine = python.Engine()
+
+        i = inode.Inode(attributes={"path": "test_path"})
+
+        mock_dataset_api.return_value.list_files.return_value = (3, [i, i, i])
+
+        # Act
+        python_engine._read_hopsfs_remote(location=None, data_format="parquet")
+
+        # Assert
+        assert mock_get_instance.call_count == 1
+        assert mock_get_instance.return_value.read_path.call_count == 3
+        assert mock_dataset_api.return_value.read_content.call_count == 0
+
     def test_read_s3(self, mocker):
         # Arrange
         mock_boto3_client = mocker.patch("boto3.client")
@@ -516,13 +759,14 @@ class TestPython:
             id=1, name="test_connector", featurestore_id=1
         )
 
-        mock_boto3_client.return_value.list_objects_v2.return_value = {
-            "is_truncated": False,
-            "Contents": [
-                {"Key": "test", "Size": 1, "Body": ""},
-                {"Key": "test1", "Size": 1, "Body": ""},
-            ],
-        }
+        mock_boto3_client.return_value.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "test", "Size": 1, "Body": ""},
+                    {"Key": "test1", "Size": 1, "Body": ""},
+                ],
+            }
+        ]
 
         # Act
         python_engine._read_s3(
@@ -536,6 +780,41 @@ class TestPython:
         assert mock_boto3_client.call_count == 1
         assert mock_python_engine_read_pandas.call_count == 2
 
+    def test_read_s3_columns(self, mocker):
+        # Arrange
+        mock_boto3_client = mocker.patch("boto3.client")
+        mock_python_engine_read_pandas = mocker.patch(
+            "hsfs.engine.python.Engine._read_pandas"
+        )
+
+        python_engine = python.Engine()
+
+        connector = storage_connector.S3Connector(
+            id=1, name="test_connector", featurestore_id=1
+        )
+
+        mock_boto3_client.return_value.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [{"Key": "test", "Size": 1, "Body": ""}],
+            }
+        ]
+
+        # Act
+        python_engine._read_s3(
+            storage_connector=connector,
+            location="",
+            data_format="parquet",
+            read_options={"columns": ["col1"], "arrow_batch_size": 1024},
+        )
+
+        # Assert
+        mock_python_engine_read_pandas.assert_called_once_with(
+            "parquet",
+            mock_boto3_client.return_value.get_object.return_value.__getitem__.return_value,
+            ["col1"],
+            1024,
+        )
+
     def test_read_s3_session_token(self, mocker):
         # Arrange
         mock_boto3_client = mocker.patch("boto3.client")
@@ -549,13 +828,14 @@ class TestPython:
             id=1, name="test_connector", featurestore_id=1, session_token="test_token"
         )
 
-        mock_boto3_client.return_value.list_objects_v2.return_value = {
-            "is_truncated": False,
-            "Contents": [
-                {"Key": "test", "Size": 1, "Body": ""},
-                {"Key": "test1", "Size": 1, "Body": ""},
-            ],
-        }
+        mock_boto3_client.return_value.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "test", "Size": 1, "Body": ""},
+                    {"Key": "test1", "Size": 1, "Body": ""},
+                ],
+            }
+        ]
 
         # Act
         python_engine._read_s3(
@@ -582,9 +862,9 @@ class TestPython:
             id=1, name="test_connector", featurestore_id=1
         )
 
-        mock_boto3_client.return_value.list_objects_v2.side_effect = [
+        mock_boto3_client.return_value.get_paginator.return_value.paginate.return_value = [
             {
-                "is_truncated": True,
+                "IsTruncated": True,
                 "NextContinuationToken": "test_token",
                 "Contents": [
                     {"Key": "test", "Size": 1, "Body": ""},
@@ -592,7 +872,7 @@ class TestPython:
                 ],
             },
             {
-                "is_truncated": False,
+                "IsTruncated": False,
                 "Contents": [
                     {"Key": "test2", "Size": 1, "Body": ""},
                     {"Key": "test3", "Size": 1, "Body": ""},
@@ -837,9 +1117,8 @@ class TestPython:
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
+        assert json.loads(result) == json.loads(
+            '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col1", "completeness": 1}, '
             '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col2", "completeness": 1}, '
@@ -875,9 +1154,8 @@ class TestPython:
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
+        assert json.loads(result) == json.loads(
+            '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col1", "completeness": 1}, '
             '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col2", "completeness": 1}, '
@@ -913,9 +1191,8 @@ class TestPython:
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
+        assert json.loads(result) == json.loads(
+            '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col1", "completeness": 1}, '
             '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col2", "completeness": 1}, '
@@ -951,9 +1228,8 @@ class TestPython:
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
+        assert json.loads(result) == json.loads(
+            '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col1", "completeness": 1}, '
             '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col2", "completeness": 1}, '
@@ -988,9 +1264,8 @@ class TestPython:
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
+        assert json.loads(result) == json.loads(
+            '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col1", "completeness": 1}]}'
         )
         assert mock_python_engine_convert_pandas_statistics.call_count == 1
@@ -1021,76 +1296,223 @@ class TestPython:
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
+        assert json.loads(result) == json.loads(
+            '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col1", "completeness": 1}, '
             '{"dataType": "String", "test_key": "test_value", "isDataTypeInferred": "false", '
             '"column": "col3", "completeness": 1}]}'
         )
         assert mock_python_engine_convert_pandas_statistics.call_count == 2
 
-    def test_convert_pandas_statistics(self):
+    def test_profile_pandas_non_numeric_columns(self):
         # Arrange
         python_engine = python.Engine()
 
-        stat = {
-            "25%": 25,
-            "50%": 50,
-            "75%": 75,
-            "mean": 50,
-            "count": 100,
-            "max": 10,
-            "std": 33,
-            "min": 1,
+        d = {
+            "col1": [1, 2, 3],
+            "col2": ["a", "b", "a"],
+            "col3": [True, False, True],
         }
+        df = pd.DataFrame(data=d)
 
         # Act
-        result = python_engine._convert_pandas_statistics(stat=stat, dataType="Integer")
+        result = python_engine.profile(
+            df=df,
+            relevant_columns=None,
+            correlations=None,
+            histograms=None,
+            exact_uniqueness=True,
+        )
 
         # Assert
-        assert result == {
-            "dataType": "Integer",
-            "approxPercentiles": [
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                25,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
+        assert json.loads(result)["columns"][1:] == [
+            {
+                "dataType": "String",
+                "count": 3,
+                "isDataTypeInferred": "false",
+                "column": "col2",
+                "completeness": 1,
+            },
+            {
+                "dataType": "Boolean",
+                "count": 3,
+                "isDataTypeInferred": "false",
+                "column": "col3",
+                "completeness": 1,
+            },
+        ]
+
+    def test_profile_pandas_datetime_columns(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        d = {
+            "col1": [1, 2, 3],
+            "event_time": pd.to_datetime(
+                ["2024-01-01 10:00:00", None, "2024-01-03 10:00:00"]
+            ).tz_localize("UTC"),
+            "event_date": [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)],
+        }
+        df = pd.DataFrame(data=d)
+
+        # Act
+        result = python_engine.profile(
+            df=df,
+            relevant_columns=["event_time", "event_date"],
+            correlations=None,
+            histograms=None,
+            exact_uniqueness=True,
+        )
+
+        # Assert
+        assert json.loads(result)["columns"] == [
+            {
+                "dataType": "String",
+                "count": 2,
+                "isDataTypeInferred": "false",
+                "column": "event_time",
+                "completeness": 1,
+            },
+            {
+                "dataType": "String",
+                "count": 3,
+                "isDataTypeInferred": "false",
+                "column": "event_date",
+                "completeness": 1,
+            },
+        ]
+        assert isinstance(df["event_time"].dtype, pd.DatetimeTZDtype)
+
+    def test_profile_polars_datetime_columns(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pl.DataFrame(
+            [
+                pl.Series("col1", [1.0, 2.0]),
+                pl.Series(
+                    "event_time",
+                    [datetime(2024, 1, 1, 10), None],
+                    pl.Datetime(time_zone="UTC"),
+                ),
+            ]
+        )
+
+        # Act
+        result = python_engine.profile(
+            df=df,
+            relevant_columns=None,
+            correlations=None,
+            histograms=None,
+            exact_uniqueness=True,
+        )
+
+        # Assert
+        columns = json.loads(result)["columns"]
+        assert columns[0]["column"] == "col1"
+        assert columns[0]["mean"] == 1.5
+        assert columns[1] == {
+            "dataType": "String",
+            "count": 1,
+            "isDataTypeInferred": "false",
+            "column": "event_time",
+            "completeness": 1,
+        }
+
+    def test_profile_without_orjson(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.python.HAS_ORJSON", False)
+        mock_python_engine_convert_pandas_statistics = mocker.patch(
+            "hsfs.engine.python.Engine._convert_pandas_statistics"
+        )
+
+        python_engine = python.Engine()
+
+        mock_python_engine_convert_pandas_statistics.return_value = {
+            "dataType": "Integral",
+            "mean": np.float64(1.5),
+        }
+
+        d = {"col1": [1, 2]}
+        df = pd.DataFrame(data=d)
+
+        # Act
+        result = python_engine.profile(
+            df=df,
+            relevant_columns=None,
+            correlations=None,
+            histograms=None,
+            exact_uniqueness=True,
+        )
+
+        # Assert
+        assert (
+            result
+            == '{"columns": [{"dataType": "Integral", "mean": 1.5, "isDataTypeInferred": "false", '
+            '"column": "col1", "completeness": 1}]}'
+        )
+
+    def test_convert_pandas_statistics(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        stat = {
+            "25%": 25,
+            "50%": 50,
+            "75%": 75,
+            "mean": 50,
+            "count": 100,
+            "max": 10,
+            "std": 33,
+            "min": 1,
+        }
+
+        # Act
+        result = python_engine._convert_pandas_statistics(stat=stat, dataType="Integer")
+
+        # Assert
+        assert result == {
+            "dataType": "Integer",
+            "approxPercentiles": [
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                25,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
                 0,
                 0,
                 0,
@@ -1262,6 +1684,39 @@ class TestPython:
             "Feature names are sanitized to use underscore '_' in the feature store."
         )
 
+    def test_convert_to_default_dataframe_pandas_timezones(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pd.DataFrame(
+            {
+                "id": [1, 2],
+                "event_time": pd.to_datetime(
+                    ["2018-09-19 13:55:26", "2018-09-20 13:55:26"]
+                ).tz_localize("Europe/Stockholm"),
+                "created": pd.to_datetime(
+                    ["2018-09-19 13:55:26", "2018-09-20 13:55:26"]
+                ).tz_localize("UTC"),
+                "updated": pd.to_datetime(
+                    ["2018-09-19 13:55:26", "2018-09-20 13:55:26"]
+                ),
+            }
+        )
+
+        # Act
+        result = python_engine.convert_to_default_dataframe(dataframe=df)
+
+        # Assert
+        assert result["event_time"].dt.tz is None
+        assert result["event_time"].tolist() == [
+            pd.Timestamp("2018-09-19 11:55:26"),
+            pd.Timestamp("2018-09-20 11:55:26"),
+        ]
+        assert result["created"].dt.tz is None
+        assert result["updated"].equals(df["updated"])
+        assert result["id"].tolist() == [1, 2]
+        assert df["event_time"].dt.tz is not None
+
     def test_convert_to_default_dataframe_polars(self, mocker):
         # Arrange
         mock_warnings = mocker.patch("warnings.warn")
@@ -1360,6 +1815,30 @@ class TestPython:
         assert result[1].name == "col2"
         assert result[2].name == "date"
 
+    def test_parse_schema_feature_group_polars_nested_types(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pl.DataFrame(
+            [
+                pl.Series("col1", [[1, 2], [3]]),
+                pl.Series("col2", [{"x": 1}, {"x": 2}]),
+                pl.Series("col3", ["a", "b"], dtype=pl.Categorical),
+            ]
+        )
+
+        # Act
+        result = python_engine.parse_schema_feature_group(
+            dataframe=df, time_travel_format=None
+        )
+
+        # Assert
+        assert [(feat.name, feat.type) for feat in result] == [
+            ("col1", "array<bigint>"),
+            ("col2", "struct<x:bigint>"),
+            ("col3", "string"),
+        ]
+
     def test_parse_schema_training_dataset(self):
         # Arrange
         python_engine = python.Engine()
@@ -1681,6 +2160,35 @@ class TestPython:
         assert isinstance(result_df, list)
         assert result_df_split is None
 
+    def test_split_labels_with_labels(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pd.DataFrame(data={"Col1": [1, 2], "col2": [3, 4], "label": [5, 6]})
+
+        # Act
+        result_df, result_df_split = python_engine.split_labels(
+            df=df, dataframe_type="pandas", labels=["label"]
+        )
+
+        # Assert
+        assert result_df.to_dict(orient="list") == {"Col1": [1, 2], "col2": [3, 4]}
+        assert result_df_split.to_dict(orient="list") == {"label": [5, 6]}
+        assert list(df.columns) == ["Col1", "col2", "label"]
+
+    def test_drop_columns(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pd.DataFrame(data={"Col1": [1, 2], "col2": [3, 4], "col3": [5, 6]})
+
+        # Act
+        result = python_engine.drop_columns(df, ["col2", "col3"])
+
+        # Assert
+        assert result.to_dict(orient="list") == {"Col1": [1, 2]}
+        assert list(df.columns) == ["Col1", "col2", "col3"]
+
     def test_split_labels_dataframe_type_numpy(self):
         # Arrange
         python_engine = python.Engine()
@@ -1843,6 +2351,78 @@ class TestPython:
         assert isinstance(result["train"], pd.DataFrame)
         assert isinstance(result["test"], pd.DataFrame)
 
+    @pytest.mark.parametrize(
+        "read_option, expected_concurrent",
+        [(None, True), ({"max_concurrent_transformations": 1}, False)],
+    )
+    def test_prepare_transform_split_df_concurrent_transformations(
+        self, mocker, read_option, expected_concurrent
+    ):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.constructor.query.Query.read")
+        mocker.patch("os.cpu_count", return_value=4)
+        mock_python_engine_random_split = mocker.patch(
+            "hsfs.engine.python.Engine._random_split"
+        )
+        mocker.patch(
+            "hsfs.core.transformation_function_engine.TransformationFunctionEngine"
+        )
+        mock_feature_view = mocker.patch("hsfs.feature_view.FeatureView")
+        threads = []
+
+        def apply_transformation_function(transformation_functions, dataset):
+            threads.append(threading.current_thread())
+            return dataset + 1
+
+        mocker.patch(
+            "hsfs.engine.python.Engine._apply_transformation_function",
+            side_effect=apply_transformation_function,
+        )
+
+        python_engine = python.Engine()
+
+        df = pd.DataFrame(data={"col1": [1, 2, 3]})
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"train": 0.4, "validation": 0.3, "test": 0.3},
+            label=["f", "f_wrong"],
+            id=10,
+        )
+
+        q = query.Query(left_feature_group=None, left_features=None)
+
+        mock_python_engine_random_split.return_value = {
+            "train": df.iloc[[0]],
+            "validation": df.iloc[[1]],
+            "test": df.iloc[[2]],
+        }
+
+        # Act
+        result = python_engine._prepare_transform_split_df(
+            query_obj=q,
+            training_dataset_obj=td,
+            feature_view_obj=mock_feature_view,
+            read_option=read_option,
+            dataframe_type="default",
+        )
+
+        # Assert
+        assert list(result.keys()) == ["train", "validation", "test"]
+        assert result["train"]["col1"].tolist() == [2]
+        assert result["validation"]["col1"].tolist() == [3]
+        assert result["test"]["col1"].tolist() == [4]
+        assert len(threads) == 3
+        assert (
+            all(thread is not threading.main_thread() for thread in threads)
+            == expected_concurrent
+        )
+
     def test_prepare_transform_split_df_time_split_td_features(self, mocker):
         # Arrange
         mocker.patch("hopsworks_common.client.get_instance")
@@ -1910,6 +2490,65 @@ class TestPython:
         assert isinstance(result["train"], pd.DataFrame)
         assert isinstance(result["test"], pd.DataFrame)
 
+    def test_prepare_transform_split_df_time_split_reads_query_once(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("hsfs.engine.get_type")
+        mock_query_read = mocker.patch("hsfs.constructor.query.Query.read")
+        mock_python_engine_time_series_split = mocker.patch(
+            "hsfs.engine.python.Engine._time_series_split", return_value={}
+        )
+        mocker.patch(
+            "hsfs.core.transformation_function_engine.TransformationFunctionEngine"
+        )
+        mock_feature_view = mocker.patch("hsfs.feature_view.FeatureView")
+
+        python_engine = python.Engine()
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"col1": None, "col2": None},
+            id=10,
+            train_start=1000000000,
+            train_end=2000000000,
+            test_end=3000000000,
+        )
+
+        f = feature.Feature(name="col1", type="str")
+        f1 = feature.Feature(name="event_time", type="str")
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            id=10,
+            event_time="event_time",
+            features=[f, f1],
+        )
+
+        q = query.Query(left_feature_group=fg, left_features=[f])
+
+        # Act
+        python_engine._prepare_transform_split_df(
+            query_obj=q,
+            training_dataset_obj=td,
+            feature_view_obj=mock_feature_view,
+            read_option=None,
+            dataframe_type="default",
+        )
+
+        # Assert
+        assert mock_query_read.call_count == 1
+        assert [feature.name for feature in q.features] == ["col1", "event_time"]
+        assert mock_python_engine_time_series_split.call_args[1] == {
+            "drop_event_time": True
+        }
+
     def test_prepare_transform_split_df_time_split_query_features(self, mocker):
         # Arrange
         mocker.patch("hopsworks_common.client.get_instance")
@@ -2060,6 +2699,68 @@ class TestPython:
         for column in list(result):
             assert not result[column].empty
 
+    def test_random_split_partitions_rows(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+
+        python_engine = python.Engine()
+
+        df = pd.DataFrame(data={"col1": list(range(10))})
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"train": 0.7, "test": 0.3},
+            id=10,
+        )
+
+        # Act
+        random.seed(1)
+        result = python_engine._random_split(df=df, training_dataset_obj=td)
+        random.seed(1)
+        result_again = python_engine._random_split(df=df, training_dataset_obj=td)
+
+        # Assert
+        assert len(result["train"]) == 7
+        assert len(result["test"]) == 3
+        assert sorted(
+            result["train"]["col1"].tolist() + result["test"]["col1"].tolist()
+        ) == list(range(10))
+        assert result["train"].index.is_monotonic_increasing
+        assert list(df.columns) == ["col1"]
+        for split in result:
+            assert result[split].equals(result_again[split])
+
+    def test_random_split_polars(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+
+        python_engine = python.Engine()
+
+        df = pl.DataFrame(data={"col1": list(range(10))})
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"train": 0.7, "test": 0.3},
+            id=10,
+        )
+
+        # Act
+        result = python_engine._random_split(df=df, training_dataset_obj=td)
+
+        # Assert
+        assert result["train"].columns == ["col1"]
+        assert len(result["train"]) == 7
+        assert len(result["test"]) == 3
+        assert sorted(
+            result["train"]["col1"].to_list() + result["test"]["col1"].to_list()
+        ) == list(range(10))
+
     def test_random_split_bad_percentage(self, mocker):
         # Arrange
         mocker.patch("hopsworks_common.client.get_instance")
@@ -2182,25 +2883,180 @@ class TestPython:
             splits={"col1": None, "col2": None},
             label=["f", "f_wrong"],
             id=10,
-            train_start=1000000000,
-            train_end=2000000000,
-            test_end=3000000000,
+            train_start=1000000000,
+            train_end=2000000000,
+            test_end=3000000000,
+        )
+
+        expected = {"train": df.loc[df["col1"] == 1], "test": df.loc[df["col1"] == 2]}
+
+        # Act
+        result = python_engine._time_series_split(
+            df=df,
+            training_dataset_obj=td,
+            event_time="event_time",
+            drop_event_time=False,
+        )
+
+        # Assert
+        assert list(result) == list(expected)
+        for column in list(result):
+            assert result[column].equals(expected[column])
+
+    def test_time_series_split_datetime_event_time(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+
+        python_engine = python.Engine()
+
+        d = {
+            "col1": [1, 2, 3],
+            "event_time": pd.to_datetime(
+                ["2017-01-01", "2017-01-02", "2017-01-03"]
+            ).tz_localize("UTC"),
+        }
+        df = pd.DataFrame(data=d)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+            id=10,
+            train_start=1483228800000,
+            train_end=1483315200000,
+            test_end=1483488000000,
+        )
+
+        # Act
+        result = python_engine._time_series_split(
+            df=df,
+            training_dataset_obj=td,
+            event_time="event_time",
+            drop_event_time=True,
+        )
+
+        # Assert
+        assert result["train"]["col1"].tolist() == [1]
+        assert result["test"]["col1"].tolist() == [2, 3]
+        assert list(result["train"].columns) == ["col1"]
+
+    def test_time_series_split_polars_datetime_event_time(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+
+        python_engine = python.Engine()
+
+        df = pl.DataFrame(
+            {
+                "col1": [1, 2, 3],
+                "event_time": [
+                    datetime(2017, 1, 1),
+                    datetime(2017, 1, 2),
+                    datetime(2017, 1, 3),
+                ],
+            }
+        )
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+            id=10,
+            train_start=1483228800000,
+            train_end=1483315200000,
+            test_end=1483488000000,
+        )
+
+        # Act
+        result = python_engine._time_series_split(
+            df=df,
+            training_dataset_obj=td,
+            event_time="event_time",
+        )
+
+        # Assert
+        assert result["train"]["col1"].to_list() == [1]
+        assert result["test"]["col1"].to_list() == [2, 3]
+
+    def test_time_series_split_polars_date_event_time(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+
+        python_engine = python.Engine()
+
+        df = pl.DataFrame(
+            {
+                "col1": [1, 2, 3],
+                "event_time": [date(2017, 1, 1), date(2017, 1, 2), date(2017, 1, 3)],
+            }
+        )
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+            id=10,
+            train_start=1483228800000,
+            train_end=1483315200000,
+            test_end=1483488000000,
         )
 
-        expected = {"train": df.loc[df["col1"] == 1], "test": df.loc[df["col1"] == 2]}
-
         # Act
         result = python_engine._time_series_split(
             df=df,
             training_dataset_obj=td,
             event_time="event_time",
-            drop_event_time=False,
         )
 
         # Assert
-        assert list(result) == list(expected)
-        for column in list(result):
-            assert result[column].equals(expected[column])
+        assert result["train"]["col1"].to_list() == [1]
+        assert result["test"]["col1"].to_list() == [2, 3]
+
+    def test_convert_event_time_to_timestamps_polars_date(self):
+        # Arrange
+        event_times = pl.Series([date(2017, 1, 1), date(2017, 1, 2)])
+
+        # Act
+        result = python.Engine._convert_event_time_to_timestamps(event_times)
+
+        # Assert
+        assert result.tolist() == [
+            util.convert_event_time_to_timestamp(date(2017, 1, 1)),
+            util.convert_event_time_to_timestamp(date(2017, 1, 2)),
+        ]
+
+    def test_convert_event_time_to_timestamps_numpy_datetime64(self, mocker):
+        # Arrange
+        event_times = mocker.Mock()
+        event_times.to_numpy.return_value = np.array(
+            ["2017-01-01", "2017-01-02"], dtype="datetime64[D]"
+        )
+        mocker.patch("pandas.api.types.is_datetime64_any_dtype", return_value=False)
+
+        # Act
+        result = python.Engine._convert_event_time_to_timestamps(event_times)
+
+        # Assert
+        assert result.tolist() == [1483228800000, 1483315200000]
+
+    def test_convert_event_time_to_timestamps_strings(self):
+        # Arrange
+        event_times = pd.Series(["2017-01-01", "2017-01-02"])
+
+        # Act
+        result = python.Engine._convert_event_time_to_timestamps(event_times)
+
+        # Assert
+        assert result.tolist() == [
+            util.convert_event_time_to_timestamp("2017-01-01"),
+            util.convert_event_time_to_timestamp("2017-01-02"),
+        ]
 
     def test_convert_to_unix_timestamp_pandas(self):
         # Act
@@ -2465,6 +3321,56 @@ class TestPython:
         # Assert
         assert result == [[1, 3], [2, 4]]
 
+    def test_return_dataframe_type_pandas_to_polars(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pd.DataFrame(
+            data={"col1": [1, 2], "col2": ["a", "b"]}, index=[3, 4]
+        ).astype({"col2": pd.ArrowDtype(pa.string())})
+
+        # Act
+        result = python_engine._return_dataframe_type(
+            dataframe=df, dataframe_type="polars"
+        )
+
+        # Assert
+        assert isinstance(result, pl.DataFrame)
+        assert result.equals(pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}))
+
+    def test_return_dataframe_type_polars_to_numpy(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        d = {"col1": [1, 2], "col2": [3, 4]}
+        df = pl.DataFrame(data=d)
+
+        # Act
+        result_numpy = python_engine._return_dataframe_type(
+            dataframe=df, dataframe_type="numpy"
+        )
+        result_python = python_engine._return_dataframe_type(
+            dataframe=df, dataframe_type="python"
+        )
+
+        # Assert
+        assert str(result_numpy) == "[[1 3]\n [2 4]]"
+        assert result_python == [[1, 3], [2, 4]]
+
+    def test_return_dataframe_type_polars_to_python_datetime(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pl.DataFrame(data={"col1": [1, 2], "col2": [datetime(2024, 1, 1)] * 2})
+
+        # Act
+        result = python_engine._return_dataframe_type(
+            dataframe=df, dataframe_type="python"
+        )
+
+        # Assert
+        assert result == [[1, datetime(2024, 1, 1)], [2, datetime(2024, 1, 1)]]
+
     def test_return_dataframe_type_other(self):
         # Arrange
         python_engine = python.Engine()
@@ -2551,6 +3457,44 @@ class TestPython:
         # Assert
         assert result == file
 
+    def test_add_file_streams_content(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("os.path.join", return_value=str(tmp_path / "keystore.jks"))
+        python_engine = python.Engine()
+        mock_read_content = mocker.patch.object(
+            python_engine._dataset_api, "read_content"
+        )
+        mock_read_content.return_value.iter_content.return_value = [b"abc", b"def"]
+
+        # Act
+        result = python_engine.add_file(file="file:///Resources/keystore.jks")
+
+        # Assert
+        assert result == str(tmp_path / "keystore.jks")
+        assert (tmp_path / "keystore.jks").read_bytes() == b"abcdef"
+        assert not (tmp_path / "keystore.jks.tmp").exists()
+
+    def test_add_file_interrupted_download(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("os.path.join", return_value=str(tmp_path / "keystore.jks"))
+        python_engine = python.Engine()
+        mock_read_content = mocker.patch.object(
+            python_engine._dataset_api, "read_content"
+        )
+
+        def iter_content(chunk_size):
+            yield b"abc"
+            raise ConnectionError("connection reset")
+
+        mock_read_content.return_value.iter_content.side_effect = iter_content
+
+        # Act
+        with pytest.raises(ConnectionError):
+            python_engine.add_file(file="file:///Resources/keystore.jks")
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
+
     def test_apply_transformation_function_pandas(self, mocker):
         # Arrange
         mocker.patch("hopsworks_common.client.get_instance")
@@ -2779,6 +3723,84 @@ class TestPython:
         assert result["plus_two_col1_col2_1"][0] == 12
         assert result["plus_two_col1_col2_1"][1] == 13
 
+    def test_apply_transformation_function_chained(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        engine._engine_type = "python"
+        python_engine = python.Engine()
+
+        @udf(int)
+        def plus_one(col1):
+            return col1 + 1
+
+        @udf(int)
+        def times_two(col1):
+            return col1 * 2
+
+        transformation_functions = [
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=plus_one("tf_name"),
+                transformation_type=TransformationType.MODEL_DEPENDENT,
+            ),
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=times_two("plus_one_tf_name_"),
+                transformation_type=TransformationType.MODEL_DEPENDENT,
+            ),
+        ]
+
+        df = pd.DataFrame(data={"tf_name": [1, 2]}, index=[5, 7])
+
+        # Act
+        result = python_engine._apply_transformation_function(
+            transformation_functions=transformation_functions, dataset=df
+        )
+
+        # Assert
+        assert list(result.columns) == [
+            "tf_name",
+            "plus_one_tf_name_",
+            "times_two_plus_one_tf_name__",
+        ]
+        assert result["tf_name"].tolist() == [1, 2]
+        assert result["plus_one_tf_name_"].tolist() == [2, 3]
+        assert result["times_two_plus_one_tf_name__"].tolist() == [4, 6]
+
+    def test_apply_transformation_function_does_not_modify_input(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        engine._engine_type = "python"
+        python_engine = python.Engine()
+
+        @udf(int, drop=["col1"])
+        def plus_one(col1):
+            return col1 + 1
+
+        transformation_functions = [
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=plus_one("col1"),
+                transformation_type=TransformationType.MODEL_DEPENDENT,
+            )
+        ]
+
+        df = pd.DataFrame(data={"col1": [1, 2], "col2": [10, 11]}, index=[3, 4])
+
+        # Act
+        result = python_engine._apply_transformation_function(
+            transformation_functions=transformation_functions, dataset=df
+        )
+        result.loc[0, "col2"] = 0
+
+        # Assert
+        assert list(result.columns) == ["col2", "plus_one_col1_"]
+        assert result.index.tolist() == [0, 1]
+        assert result["plus_one_col1_"].tolist() == [2, 3]
+        assert list(df.columns) == ["col1", "col2"]
+        assert df.index.tolist() == [3, 4]
+        assert df["col2"].tolist() == [10, 11]
+
     def test_apply_transformation_function_polars(self, mocker):
         # Arrange
         mocker.patch("hopsworks_common.client.get_instance")
@@ -2895,6 +3917,138 @@ class TestPython:
             await_termination=False,
         )
 
+    def test_get_kafka_rows(self):
+        # Arrange
+        df = pd.DataFrame(
+            data={
+                "col1": [1, 2],
+                "col2": pd.array([1.5, None], dtype="Float64"),
+                "col3": pd.to_datetime(["2024-01-01", None]),
+                "col4": pd.to_datetime(["2024-01-01", "2024-01-02"]).tz_localize(
+                    "Europe/Stockholm"
+                ),
+                "col5": [np.array([1, 2]), pd.Timestamp("2024-01-03")],
+            }
+        )
+
+        # Act
+        result = list(python.Engine._get_kafka_rows(df))
+
+        # Assert
+        assert result[0] == {
+            "col1": 1,
+            "col2": 1.5,
+            "col3": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "col4": pd.Timestamp("2024-01-01", tz="Europe/Stockholm").to_pydatetime(),
+            "col5": [1, 2],
+        }
+        assert result[1]["col2"] is None
+        assert result[1]["col3"] is pd.NaT
+        assert result[1]["col5"] == datetime(2024, 1, 3, tzinfo=timezone.utc)
+        assert type(result[0]["col1"]) is int
+        assert type(result[0]["col4"]) is datetime
+
+    def test_get_kafka_rows_batches(self, mocker):
+        # Arrange
+        df = pd.DataFrame(
+            data={
+                "col1": [1, 2, 3],
+                "col2": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            }
+        )
+        mock_get_kafka_batch_rows = mocker.spy(python.Engine, "_get_kafka_batch_rows")
+
+        # Act
+        result = list(python.Engine._get_kafka_rows(df, batch_size=2))
+
+        # Assert
+        assert result == [
+            {"col1": 1, "col2": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+            {"col1": 2, "col2": datetime(2024, 1, 2, tzinfo=timezone.utc)},
+            {"col1": 3, "col2": datetime(2024, 1, 3, tzinfo=timezone.utc)},
+        ]
+        assert [
+            len(call.args[0]) for call in mock_get_kafka_batch_rows.call_args_list
+        ] == [2, 1]
+
+    def test_materialization_kafka_encoded_rows(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.kafka_engine.get_kafka_config", return_value={})
+        mocker.patch("hsfs.feature_group.FeatureGroup._get_encoded_avro_schema")
+        encoded_rows = []
+
+        def writer(row, outf):
+            encoded_rows.append(dict(row))
+            outf.write(str(row["col1"]).encode())
+
+        mocker.patch("hsfs.core.kafka_engine.get_encoder_func", return_value=writer)
+        mocker.patch(
+            "hsfs.core.kafka_engine.encode_complex_features",
+            side_effect=lambda feature_writers, row: row,
+        )
+        mock_python_engine_kafka_produce = mocker.patch(
+            "hsfs.core.kafka_engine.kafka_produce"
+        )
+        mocker.patch("hsfs.util.get_job_url")
+        mocker.patch(
+            "hsfs.core.kafka_engine.kafka_get_offsets",
+            return_value=" tests_offsets",
+        )
+        mocker.patch("hopsworks_common.client.get_instance")
+
+        python_engine = python.Engine()
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["col1"],
+            partition_key=[],
+            id=10,
+            stream=False,
+            time_travel_format="HUDI",
+        )
+        fg.primary_key = ["col1"]
+        fg._online_topic_name = "test_topic"
+        fg._materialization_job = mocker.MagicMock()
+
+        df = pd.DataFrame(
+            data={
+                "col1": [10, 2],
+                "_col2": pd.array([1, None], dtype="Int64"),
+                "event_time": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            }
+        )
+
+        # Act
+        python_engine._write_dataframe_kafka(
+            feature_group=fg,
+            dataframe=df,
+            offline_write_options={"start_offline_materialization": False},
+        )
+
+        # Assert
+        assert encoded_rows == [
+            {
+                "col1": 10,
+                "_col2": 1,
+                "event_time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            },
+            {
+                "col1": 2,
+                "_col2": None,
+                "event_time": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            },
+        ]
+        assert [
+            call.kwargs["encoded_row"]
+            for call in mock_python_engine_kafka_produce.call_args_list
+        ] == [b"10", b"2"]
+        assert [
+            call.kwargs["key"]
+            for call in mock_python_engine_kafka_produce.call_args_list
+        ] == ["10", "2"]
+
     def test_materialization_kafka_first_job_execution(self, mocker):
         # Arrange
         mocker.patch("hsfs.core.kafka_engine.get_kafka_config", return_value={})
@@ -3084,3 +4238,197 @@ class TestPython:
         fg._materialization_job = job_mock
 
         assert fg.materialization_job.config == {"defaultArgs": "defaults"}
+
+    def test_get_feature_logging_df_non_default_index(self, mocker):
+        # Arrange
+        fg = feature_group.FeatureGroup(
+            name="log_fg",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            features=[
+                feature.Feature("col1"),
+                feature.Feature("td_version"),
+                feature.Feature("model"),
+                feature.Feature("log_time"),
+                feature.Feature("log_id"),
+            ],
+            id=10,
+            stream=False,
+        )
+        hsml_model = mocker.Mock()
+        hsml_model.name = "model_name"
+        hsml_model.version = 2
+        features = pd.DataFrame({"col1": [1, 2]}, index=[5, 7])
+
+        # Act
+        result = python.Engine.get_feature_logging_df(
+            features,
+            fg=fg,
+            td_features=["col1"],
+            td_col_name="td_version",
+            time_col_name="log_time",
+            model_col_name="model",
+            training_dataset_version=3,
+            hsml_model=hsml_model,
+        )
+
+        # Assert
+        assert list(result.columns) == [
+            "col1",
+            "td_version",
+            "model",
+            "log_time",
+            "log_id",
+        ]
+        assert result["td_version"].tolist() == [3, 3]
+        assert result["model"].tolist() == ["model_name_2", "model_name_2"]
+        assert result["model"].dtype == pd.StringDtype()
+        assert result["log_time"].notna().all()
+        assert result["log_time"].dtype == "datetime64[ns]"
+        assert result["log_id"].nunique() == 2
+
+    def test_get_feature_logging_df_non_default_index_with_predictions(self):
+        # Arrange
+        fg = feature_group.FeatureGroup(
+            name="log_fg",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            features=[
+                feature.Feature("col1"),
+                feature.Feature("label"),
+                feature.Feature("td_version"),
+                feature.Feature("model"),
+                feature.Feature("log_time"),
+                feature.Feature("log_id"),
+            ],
+            id=10,
+            stream=False,
+        )
+        features = pd.DataFrame({"col1": [1, 2, 3]}, index=[10, 11, 12])
+
+        # Act
+        result = python.Engine.get_feature_logging_df(
+            features,
+            fg=fg,
+            td_features=["col1"],
+            td_predictions=[TrainingDatasetFeature(name="label", type="bigint")],
+            td_col_name="td_version",
+            time_col_name="log_time",
+            model_col_name="model",
+            predictions=[[1], [0], [1]],
+            training_dataset_version=3,
+        )
+
+        # Assert
+        assert len(result) == 3
+        assert result["col1"].tolist() == [1, 2, 3]
+        assert result["label"].tolist() == [1, 0, 1]
+        assert result["td_version"].tolist() == [3, 3, 3]
+        assert result["log_time"].notna().all()
+        assert result["log_id"].notna().all()
+        assert result["log_id"].nunique() == 3
+
+    def test_get_feature_logging_df_with_predictions(self, mocker):
+        # Arrange
+        fg = feature_group.FeatureGroup(
+            name="log_fg",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            features=[
+                feature.Feature("col1"),
+                feature.Feature("label"),
+                feature.Feature("td_version"),
+                feature.Feature("model"),
+                feature.Feature("log_time"),
+                feature.Feature("log_id"),
+            ],
+            id=10,
+            stream=False,
+        )
+        features = pd.DataFrame({"col1": [1, 2]})
+
+        # Act
+        result = python.Engine.get_feature_logging_df(
+            features,
+            fg=fg,
+            td_features=["col1"],
+            td_predictions=[TrainingDatasetFeature(name="label", type="bigint")],
+            td_col_name="td_version",
+            time_col_name="log_time",
+            model_col_name="model",
+            predictions=[[10], [20]],
+            training_dataset_version=3,
+        )
+
+        # Assert
+        assert result["col1"].tolist() == [1, 2]
+        assert result["label"].tolist() == [10, 20]
+        assert list(features.columns) == ["col1"]
+
+    def test_get_feature_logging_df_selects_feature_group_columns(self):
+        # Arrange
+        fg = feature_group.FeatureGroup(
+            name="log_fg",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            features=[
+                feature.Feature("log_id"),
+                feature.Feature("col2"),
+                feature.Feature("td_version"),
+                feature.Feature("model"),
+                feature.Feature("log_time"),
+            ],
+            id=10,
+            stream=False,
+        )
+        features = pd.DataFrame({"col1": [1, 2], "col2": [3, 4]})
+
+        # Act
+        result = python.Engine.get_feature_logging_df(
+            features,
+            fg=fg,
+            td_features=["col1", "col2"],
+            td_col_name="td_version",
+            time_col_name="log_time",
+            model_col_name="model",
+            training_dataset_version=3,
+        )
+
+        # Assert
+        assert list(result.columns) == [
+            "log_id",
+            "col2",
+            "td_version",
+            "model",
+            "log_time",
+        ]
+        assert result["col2"].tolist() == [3, 4]
+        assert list(features.columns) == ["col1", "col2"]
+
+    def test_generate_log_ids(self):
+        # Act
+        result = python.Engine._generate_log_ids(1000)
+
+        # Assert
+        assert len(result) == 1000
+        assert len(set(result)) == 1000
+        for log_id in result:
+            parsed = uuid.UUID(log_id)
+            assert str(parsed) == log_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
+    def test_generate_log_ids_empty(self):
+        # Act
+        result = python.Engine._generate_log_ids(0)
+
+        # Assert
+        assert len(result) == 0
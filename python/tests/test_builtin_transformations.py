@@ -0,0 +1,65 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import numpy as np
+import pandas as pd
+from hsfs.builtin_transformations import label_encoder
+from hsfs.statistics import FeatureDescriptiveStatistics
+from hsfs.transformation_function import TransformationFunction, TransformationType
+
+
+class TestBuiltinTransformations:
+    def _label_encoder_udf(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        tf = TransformationFunction(
+            featurestore_id=99,
+            hopsworks_udf=label_encoder("col_0"),
+            transformation_type=TransformationType.MODEL_DEPENDENT,
+        )
+        tf.transformation_statistics = [
+            FeatureDescriptiveStatistics(
+                feature_name="col_0",
+                extended_statistics={"unique_values": ["b", "a", "c"]},
+            )
+        ]
+        return tf.hopsworks_udf.get_udf(force_python_udf=True)
+
+    def test_label_encoder_unseen_category(self, mocker):
+        # Arrange
+        label_encoder_udf = self._label_encoder_udf(mocker)
+        feature = pd.Series(["c", "a", "x"], index=[10, 20, 30])
+
+        # Act
+        result = label_encoder_udf(feature)
+
+        # Assert
+        pd.testing.assert_series_equal(
+            result, pd.Series([2, 0, -1], name="label_encoder_col_0_")
+        )
+        assert result.dtype == np.int64
+
+    def test_label_encoder_null(self, mocker):
+        # Arrange
+        label_encoder_udf = self._label_encoder_udf(mocker)
+        feature = pd.Series(["c", None, "x"], index=[10, 20, 30])
+
+        # Act
+        result = label_encoder_udf(feature)
+
+        # Assert
+        pd.testing.assert_series_equal(
+            result, pd.Series([2, np.nan, -1], name="label_encoder_col_0_")
+        )
+        assert result.dtype == np.float64
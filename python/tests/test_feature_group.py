@@ -654,6 +654,35 @@ class TestFeatureGroup:
             validation_options={"save_report": False},
         )
 
+    def test_get_feature_avro_schema(self, mocker):
+        # Arrange
+        mock_get_subject = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine.get_subject",
+            return_value={
+                "schema": '{"type": "record", "name": "test_1", "fields": ['
+                '{"name": "pk", "type": ["null", "long"]}, '
+                '{"name": "arr", "type": ["null", {"type": "array", "items": "long"}]}]}'
+            },
+        )
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        # Act
+        arr_schema = fg._get_feature_avro_schema("arr")
+        pk_schema = fg._get_feature_avro_schema("pk")
+
+        # Assert
+        assert arr_schema == '["null", {"type": "array", "items": "long"}]'
+        assert pk_schema == '["null", "long"]'
+        assert fg._get_feature_avro_schema("missing") is None
+        assert mock_get_subject.call_count == 1
+
 
 class TestExternalFeatureGroup:
     def test_from_response_json(self, backend_fixtures):
@@ -13,8 +13,10 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import time
 import warnings
 
+import pytest
 from hsfs import feature_view, training_dataset_feature
 from hsfs.constructor import fs_query, query
 from hsfs.feature_store import FeatureStore
@@ -169,3 +171,82 @@ class TestFeatureView:
         transformation_functions = fv.transformation_functions
 
         assert transformation_functions[0] != transformation_functions[1]
+
+    def _feature_view_with_vector_db(self, mocker, backend_fixtures):
+        mocker.patch("hsfs.core.feature_view_engine.FeatureViewEngine")
+        q = fs_query.FsQuery.from_response_json(
+            backend_fixtures["fs_query"]["get"]["response"]
+        )
+        fv = feature_view.FeatureView(
+            featurestore_id=99, name="test_fv", version=1, query=q
+        )
+        fv._FeatureView__vector_server = mocker.Mock(_serving_initialized=True)
+        fv._vector_db_client = mocker.Mock()
+        return fv
+
+    def test_get_feature_vectors_vector_db_results_in_entry_order(
+        self, mocker, backend_fixtures
+    ):
+        # Arrange
+        fv = self._feature_view_with_vector_db(mocker, backend_fixtures)
+        entries = [
+            {"id": i}
+            for i in range(3 * feature_view.FeatureView.MAX_VECTOR_DB_PARALLEL_READS)
+        ]
+
+        def get_vector_db_result(entry):
+            # finish later entries first so completion order differs from entry order
+            time.sleep(0.001 * (len(entries) - entry["id"]))
+            return {"embedding": entry["id"]}
+
+        mocker.patch.object(
+            fv, "_get_vector_db_result", side_effect=get_vector_db_result
+        )
+
+        # Act
+        fv.get_feature_vectors(entry=entries)
+
+        # Assert
+        vector_db_features = fv._vector_server.get_feature_vectors.call_args.kwargs[
+            "vector_db_features"
+        ]
+        assert vector_db_features == [{"embedding": i} for i in range(len(entries))]
+
+    def test_get_feature_vectors_vector_db_no_entries(self, mocker, backend_fixtures):
+        # Arrange
+        fv = self._feature_view_with_vector_db(mocker, backend_fixtures)
+        mock_executor = mocker.patch("hsfs.feature_view.ThreadPoolExecutor")
+        mock_get_vector_db_result = mocker.patch.object(fv, "_get_vector_db_result")
+
+        # Act
+        fv.get_feature_vectors(entry=[])
+
+        # Assert
+        mock_executor.assert_not_called()
+        mock_get_vector_db_result.assert_not_called()
+        assert (
+            fv._vector_server.get_feature_vectors.call_args.kwargs["vector_db_features"]
+            == []
+        )
+
+    def test_get_feature_vectors_vector_db_error_propagates(
+        self, mocker, backend_fixtures
+    ):
+        # Arrange
+        fv = self._feature_view_with_vector_db(mocker, backend_fixtures)
+
+        def get_vector_db_result(entry):
+            if entry["id"] == 5:
+                raise ValueError("lookup failed")
+            return {"embedding": entry["id"]}
+
+        mocker.patch.object(
+            fv, "_get_vector_db_result", side_effect=get_vector_db_result
+        )
+
+        # Act
+        with pytest.raises(ValueError, match="lookup failed"):
+            fv.get_feature_vectors(entry=[{"id": i} for i in range(10)])
+
+        # Assert
+        fv._vector_server.get_feature_vectors.assert_not_called()
@@ -768,6 +768,26 @@ def test_function():
         assert all(result.columns == ["test_func_col1_col2_0", "test_func_col1_col2_1"])
         assert result.values.tolist() == [[2, 12], [3, 22], [4, 32], [5, 42]]
 
+    def test_get_udf_python_cached(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(int)
+        def test_func(col1):
+            return col1 + 1
+
+        test_func.output_column_names = ["test_func_col1_"]
+        mock_wrapper = mocker.spy(test_func, "hopsworksUdf_wrapper")
+
+        first_udf = test_func.get_udf()
+        second_udf = test_func.get_udf()
+        test_func.output_column_names = ["renamed_col1_"]
+        renamed_udf = test_func.get_udf()
+
+        assert first_udf is second_udf
+        assert renamed_udf is not first_udf
+        assert mock_wrapper.call_count == 2
+        assert renamed_udf(pd.Series([1, 2])).name == "renamed_col1_"
+
     def test_HopsworkUDf_call_one_argument(self):
         @udf(int)
         def test_func(col1):
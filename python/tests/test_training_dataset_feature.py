@@ -91,3 +91,59 @@ class TestTrainingDatasetFeature:
         assert td_feature._feature_group is None
         assert td_feature._feature_group_feature_name is None
         assert td_feature.label is False
+
+    def test_from_response_json_list(self, backend_fixtures):
+        # Arrange
+        json = backend_fixtures["training_dataset_feature"][
+            "get_fraud_online_training_dataset_features"
+        ]["response"]
+
+        # Act
+        td_features = [
+            training_dataset_feature.TrainingDatasetFeature.from_response_json(
+                feature_json
+            )
+            for feature_json in json
+        ]
+
+        # Assert
+        assert [td_feature.name for td_feature in td_features][:2] == [
+            "datetime",
+            "cc_num",
+        ]
+        assert td_features[0].feature_group_feature_name == "datetime"
+        assert [td_feature.label for td_feature in td_features].count(True) == 1
+        assert td_features[6].inference_helper_column is True
+        assert td_features[7].training_helper_column is True
+
+    def test_is_complex(self):
+        # Arrange
+        td_features = [
+            training_dataset_feature.TrainingDatasetFeature(name="f", type=t)
+            for t in ["array<int>", "struct<a:int>", "map<string,int>", "bigint", None]
+        ]
+
+        # Act
+        result = [td_feature.is_complex() for td_feature in td_features]
+
+        # Assert
+        assert result == [True, True, True, False, False]
+
+    def test_from_response_json_shared_feature_groups(self, backend_fixtures):
+        # Arrange
+        fg_json = backend_fixtures["feature_group"]["get"]["response"]
+        feature_groups = {}
+
+        # Act
+        td_features = [
+            training_dataset_feature.TrainingDatasetFeature.from_response_json(
+                {"name": name, "type": "bigint", "featuregroup": fg_json},
+                feature_groups=feature_groups,
+            )
+            for name in ["f1", "f2"]
+        ]
+
+        # Assert
+        assert isinstance(td_features[0].feature_group, feature_group.FeatureGroup)
+        assert td_features[0].feature_group is td_features[1].feature_group
+        assert list(feature_groups) == [td_features[0].feature_group.id]